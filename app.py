@@ -1,35 +1,433 @@
+import csv
+import hashlib
+import mimetypes
+import multiprocessing
 import os
 import json
-from flask import Flask, flash, render_template, request, session, redirect
-from datetime import datetime, date
+import platform
+import random
+import re
+from collections import Counter
+from functools import wraps
+from operator import attrgetter
+from flask import (
+    Flask,
+    Response,
+    abort,
+    request_finished,
+    request_started,
+    flash,
+    g,
+    jsonify,
+    redirect,
+    render_template,
+    request,
+    send_file,
+    send_from_directory,
+    has_request_context,
+    session,
+    stream_with_context,
+    url_for,
+)
+from datetime import datetime, date, timedelta, timezone
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import joinedload, selectinload
+import click
 from flask_session import Session
 from flask_migrate import Migrate
+import werkzeug.utils
 from werkzeug.security import check_password_hash, generate_password_hash
-from helpers import login_required
+from cache import make_cache
+from jobs import JobQueue, WorkerPool
+from media import extract_text, make_thumbnail
+from metrics import Metrics, latency_summary
+from notify import make_sink
+from profiler import RequestProfiler
+from storage import BlobStore, InvalidUpload
+from helpers import (
+    compress_response,
+    csv_lines,
+    HIGHLIGHT_END,
+    HIGHLIGHT_START,
+    encode_cursor,
+    file_fingerprint,
+    fts_query,
+    highlight_markup,
+    ical_calendar,
+    precompress,
+    iter_records,
+    keyset_page,
+    keyset_query,
+    login_required,
+    ndjson_lines,
+    parse_date,
+    record_format,
+    timed,
+)
 import secrets
+import time
 
 
 app = Flask(__name__)
 app.debug = True
-app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///app_tracker.db"
-app.config["UPLOAD_EXTENSIONS"] = [".jpg", ".png", ".gif", "pdf"]
+app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get(
+    "DATABASE_URL", "sqlite:///app_tracker.db"
+)
+# applied to every new SQLite connection: WAL lets readers run alongside the
+# one writer and busy_timeout makes writers wait for the lock instead of failing
+app.config["SQLITE_PRAGMAS"] = {
+    "journal_mode": os.environ.get("SQLITE_JOURNAL_MODE", "wal"),
+    "synchronous": os.environ.get("SQLITE_SYNCHRONOUS", "normal"),
+    "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", 5000)),
+    # negative sizes are in KiB
+    "cache_size": int(os.environ.get("SQLITE_CACHE_SIZE", -64 * 1024)),
+    "mmap_size": int(os.environ.get("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)),
+    "temp_store": os.environ.get("SQLITE_TEMP_STORE", "memory"),
+}
+if ":memory:" not in app.config["SQLALCHEMY_DATABASE_URI"]:
+    # SQLite allows one writer at a time, so connections beyond one per worker
+    # thread only queue on the lock; keep the pool close to the thread count
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", 5)),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 5)),
+        "pool_timeout": int(os.environ.get("DB_POOL_TIMEOUT", 30)),
+    }
+app.config["UPLOAD_EXTENSIONS"] = [".jpg", ".png", ".gif", ".pdf"]
+# content-addressed blobs for materials, defaults to instance/uploads
+app.config["UPLOAD_FOLDER"] = os.environ.get("UPLOAD_FOLDER")
+# internal nginx location that aliases UPLOAD_FOLDER; when set, downloads are
+# handed to nginx with X-Accel-Redirect instead of being read by the app:
+#   location /_uploads/ { internal; alias /path/to/instance/uploads/; }
+app.config["UPLOAD_ACCEL_REDIRECT"] = os.environ.get("UPLOAD_ACCEL_REDIRECT")
+# thumbnails and PDF text, keyed by blob; defaults to instance/derived
+app.config["DERIVED_FOLDER"] = os.environ.get("DERIVED_FOLDER")
+app.config["THUMBNAIL_SIZE"] = 256
+# persistent job queue, defaults to instance/jobs.sqlite3
+app.config["JOB_QUEUE_PATH"] = os.environ.get("JOB_QUEUE_PATH")
+# worker threads per app process; 0 leaves the jobs to 'flask run-worker'
+app.config["JOB_WORKERS"] = int(os.environ.get("JOB_WORKERS", 2))
+# days before a deadline to remind; each deadline gets the nearest window only
+app.config["REMINDER_WINDOWS"] = [7, 1]
+app.config["REMINDER_INTERVAL"] = 300
+# opportunities in these states need no more deadline reminders
+app.config["REMINDER_SKIP_STATUSES"] = ["Applied", "Got Decision"]
+app.config["REMINDER_SINK"] = os.environ.get("REMINDER_SINK", "file")
+app.config["REMINDER_FILE"] = os.environ.get("REMINDER_FILE")
+app.config["SMTP_HOST"] = os.environ.get("SMTP_HOST", "localhost")
+app.config["SMTP_PORT"] = int(os.environ.get("SMTP_PORT", 25))
+app.config["SMTP_SENDER"] = os.environ.get("SMTP_SENDER", "reminders@localhost")
+# unreferenced blobs younger than this may belong to an upload in progress
+app.config["BLOB_GC_GRACE_SECONDS"] = 60 * 60
+# how often run-scheduler sweeps up the blobs the grace period left behind
+app.config["BLOB_GC_INTERVAL"] = 60 * 60
 app.config["SESSION_PERMANENT"] = False
+app.config["DEADLINE_WINDOW_DAYS"] = 14
+app.config["PAGE_SIZE"] = 50
+app.config["MAX_PAGE_SIZE"] = 200
+app.config["MAX_CALENDAR_WINDOW_DAYS"] = 366
+app.config["IMPORT_BATCH_SIZE"] = 500
+app.config["MAX_IMPORT_ERRORS"] = 1000
+app.config["EXPORT_CHUNK_SIZE"] = 1000
+app.config["STATIC_MAX_AGE"] = 365 * 24 * 60 * 60
+app.config["FULLCALENDAR_DIR"] = "fullcalendar/packages"
+app.config["ASSET_BUILD_DIR"] = "build"
+app.config["COMPRESS_MIN_SIZE"] = 1024
+app.config["COMPRESS_LEVEL"] = 6
+app.config["COMPRESS_BR_LEVEL"] = 4
+app.config["COMPRESS_STREAM_FLUSH_SIZE"] = 16 * 1024
+# sqlite is shared by every worker process, so a write in one invalidates
+# what the others serve; memory is only safe with a single worker
+app.config["CACHE_BACKEND"] = os.environ.get("CACHE_BACKEND", "sqlite")
+app.config["CACHE_PATH"] = os.environ.get("CACHE_PATH")
+app.config["CACHE_MAX_ENTRIES"] = 10000
+app.config["CACHE_TTL"] = 300
+# bearer token for /metrics and /cache/stats; unset, both are disabled
+app.config["OPS_TOKEN"] = os.environ.get("OPS_TOKEN")
+# when testing, fail any request that issues more SQL statements than this
+app.config["SQL_STATEMENT_LIMIT"] = None
+# log a warning for requests slower or chattier than this
+app.config["SLOW_REQUEST_SECONDS"] = 0.5
+app.config["SLOW_REQUEST_SQL_STATEMENTS"] = 25
+# usernames allowed to profile a request with ?profile=1 or an X-Profile header
+app.config["PROFILE_USERS"] = set(
+    filter(None, os.environ.get("PROFILE_USERS", "").split(","))
+)
+app.config["PROFILE_DIR"] = os.environ.get("PROFILE_DIR")
+app.config["COMPRESS_MIMETYPES"] = {
+    "text/html",
+    "text/css",
+    "text/csv",
+    "text/calendar",
+    "text/javascript",
+    "text/plain",
+    "application/json",
+    "application/x-ndjson",
+}
 db = SQLAlchemy(app)
-migrate = Migrate(app, db)
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    # the search index is a virtual table owned by its migration, not a model
+    return not (type_ == "table" and name.startswith("opportunity_fts"))
+
+
+migrate = Migrate(app, db, include_object=include_object)
 app.secret_key = secrets.token_hex(32)
 app.static_folder = "static"  # Set the static folder to 'static'
 app.static_url_path = "/static"
+cache = make_cache(app.config, app.instance_path, app.logger)
+storage = BlobStore(
+    app.config["UPLOAD_FOLDER"] or os.path.join(app.instance_path, "uploads"),
+    app.config["UPLOAD_EXTENSIONS"],
+)
+derived_folder = app.config["DERIVED_FOLDER"] or os.path.join(
+    app.instance_path, "derived"
+)
+jobs = JobQueue(
+    app.config["JOB_QUEUE_PATH"] or os.path.join(app.instance_path, "jobs.sqlite3")
+)
+
+
+# job kind -> file suffix of its result
+MATERIAL_JOBS = {"thumbnail": ".png", "text": ".txt"}
+
+
+def derived_path(kind, key):
+    """Where the result of a material job for a blob is stored"""
+    return os.path.join(
+        derived_folder,
+        *f"{storage.relpath(key)}.{kind}{MATERIAL_JOBS[kind]}".split("/"),
+    )
+
+
+def material_jobs(key):
+    """Job kinds that apply to a blob, only PDFs have text to extract"""
+    return ["thumbnail", "text"] if key.endswith(".pdf") else ["thumbnail"]
+
+
+def thumbnail_job(key):
+    make_thumbnail(
+        storage.path(key), derived_path("thumbnail", key), app.config["THUMBNAIL_SIZE"]
+    )
+
+
+def text_job(key):
+    extract_text(storage.path(key), derived_path("text", key))
+
+
+workers = WorkerPool(
+    jobs,
+    {"thumbnail": thumbnail_job, "text": text_job},
+    workers=app.config["JOB_WORKERS"],
+    logger=app.logger,
+)
+
+
+def enqueue_material_jobs(key):
+    """Queue the processing of a blob; a blob already processed is skipped"""
+    for kind in material_jobs(key):
+        jobs.enqueue(kind, key)
+    # started on first use so CLI commands don't spawn idle threads
+    if app.config["JOB_WORKERS"]:
+        workers.start()
+
+
+class TooManyStatements(AssertionError):
+    """A request issued more SQL statements than SQL_STATEMENT_LIMIT allows"""
+
+
+metrics = Metrics()
+
+
+def apply_sqlite_pragmas(engine, pragmas):
+    """Run the given PRAGMA settings on every connection the engine opens"""
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+with app.app_context():
+    apply_sqlite_pragmas(db.engine, app.config["SQLITE_PRAGMAS"])
+
+    @event.listens_for(db.engine, "before_cursor_execute")
+    def start_statement(conn, cursor, statement, parameters, context, executemany):
+        # kept on the statement's own context, so one that raises leaves
+        # nothing behind to skew the next statement's timing
+        context._query_start = time.perf_counter()
+
+    @event.listens_for(db.engine, "after_cursor_execute")
+    def end_statement(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_start
+        if has_request_context():
+            g.sql_statements = g.get("sql_statements", 0) + 1
+            g.sql_seconds = g.get("sql_seconds", 0) + elapsed
+
+
+@request_started.connect_via(app)
+def start_request_timer(sender, **extra):
+    # reset explicitly, g outlives the request when an app context is already
+    # pushed (CLI commands driving the test client)
+    g.request_started = time.perf_counter()
+    g.sql_statements, g.sql_seconds = 0, 0
+
+
+@request_finished.connect_via(app)
+def record_request(sender, response, **extra):
+    elapsed = time.perf_counter() - g.pop("request_started", time.perf_counter())
+    statements, sql_seconds = g.get("sql_statements", 0), g.get("sql_seconds", 0)
+    endpoint = request.endpoint or "unmatched"
+    metrics.observe(
+        endpoint, request.method, response.status_code, elapsed, statements, sql_seconds
+    )
+    if (
+        elapsed > app.config["SLOW_REQUEST_SECONDS"]
+        or statements > app.config["SLOW_REQUEST_SQL_STATEMENTS"]
+    ):
+        app.logger.warning(
+            "slow request: %s %s (%s) took %.0f ms with %d SQL statements (%.0f ms)",
+            request.method,
+            request.path,
+            endpoint,
+            elapsed * 1000,
+            statements,
+            sql_seconds * 1000,
+        )
+
+
+@app.before_request
+def start_profiler():
+    if "profile" not in request.args and "X-Profile" not in request.headers:
+        return
+    if not session.get("user_id") or not app.config["PROFILE_USERS"]:
+        return
+    user = db.session.get(User, session["user_id"])
+    if user is None or user.username not in app.config["PROFILE_USERS"]:
+        return
+    profiler = RequestProfiler()
+    if profiler.start():
+        g.profiler = profiler
+    else:
+        app.logger.info("not profiling %s, another request is", request.path)
+
+
+def save_profile():
+    """Stop the request's profiler, if any, and write its files"""
+    profiler = g.pop("profiler", None)
+    if profiler is None:
+        return None
+    profiler.stop()
+    name = "{}-{}-{}".format(
+        datetime.now().strftime("%Y%m%dT%H%M%S"),
+        request.endpoint or "unmatched",
+        secrets.token_hex(3),
+    )
+    directory = app.config["PROFILE_DIR"] or os.path.join(app.instance_path, "profiles")
+    path = profiler.save(directory, name)
+    app.logger.info(
+        "profile for %s %s written to %s", request.method, request.path, path
+    )
+    return name
+
+
+@app.teardown_request
+def finish_profiler(exc):
+    # a view that raised never reaches after_request
+    save_profile()
+
+
+@app.template_global()
+def static_url(filename):
+    """URL for a static file carrying its content hash, so it can be cached forever"""
+    try:
+        version = file_fingerprint(os.path.join(app.static_folder, filename))
+    except OSError:
+        return url_for("static", filename=filename)
+    return url_for("static", filename=filename, v=version)
+
+
+# (Accept-Encoding token, file suffix) in order of preference
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+
+def send_static(filename):
+    """
+    Serve a static file, preferring a precompressed sibling the client accepts.
+
+    Nothing is compressed per request: the .br/.gz files are written by
+    'flask build-assets'.
+    """
+    variants = [
+        (encoding, suffix)
+        for encoding, suffix in PRECOMPRESSED
+        if os.path.isfile(os.path.join(app.static_folder, filename + suffix))
+    ]
+    for encoding, suffix in variants:
+        if request.accept_encodings[encoding]:
+            response = send_from_directory(
+                app.static_folder,
+                filename + suffix,
+                mimetype=mimetypes.guess_type(filename)[0],
+            )
+            response.headers["Content-Encoding"] = encoding
+            break
+    else:
+        response = app.send_static_file(filename)
+    if variants:
+        response.vary.add("Accept-Encoding")
+    return response
+
+
+app.view_functions["static"] = send_static
+
+
+def static_cache_control(filename):
+    # a URL whose hash matches the file can never change; anything else must
+    # revalidate against the ETag Flask already sends for static files
+    try:
+        version = file_fingerprint(os.path.join(app.static_folder, filename))
+    except OSError:
+        return None
+    if request.args.get("v") == version:
+        return f"public, max-age={app.config['STATIC_MAX_AGE']}, immutable"
+    return "public, no-cache"
 
 
 @app.after_request
 def after_request(response):
-    """Ensure responses aren't cached"""
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-    response.headers["Expires"] = 0
-    response.headers["Pragma"] = "no-cache"
-    return response
+    """Cache static files by fingerprint and never store authenticated pages"""
+    limit = app.config["SQL_STATEMENT_LIMIT"]
+    if app.testing and limit is not None and g.get("sql_statements", 0) > limit:
+        raise TooManyStatements(
+            f"{request.endpoint} issued {g.sql_statements} SQL statements, "
+            f"the limit is {limit}"
+        )
+    if request.endpoint == "static":
+        cache_control = static_cache_control(request.view_args["filename"])
+        if cache_control:
+            response.headers["Cache-Control"] = cache_control
+    elif "Cache-Control" in response.headers:
+        pass
+    elif response.mimetype == "text/html" and session.get("user_id"):
+        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
+        response.headers["Expires"] = 0
+        response.headers["Pragma"] = "no-cache"
+    profile = save_profile()
+    if profile:
+        response.headers["X-Profile"] = profile
+    if "server_timing" in g:
+        response.headers["Server-Timing"] = ", ".join(
+            f"{name};dur={elapsed:.1f}" for name, elapsed in g.server_timing
+        )
+    return compress_response(response)
 
 
 class User(db.Model):
@@ -39,6 +437,7 @@ class User(db.Model):
     username = db.Column(db.String(255), nullable=False)
     password = db.Column(db.String(255), nullable=False)
     created_at = db.Column(db.DateTime, default=db.func.utcnow)
+    feed_token = db.Column(db.String(64), index=True, unique=True)
     opps = db.relationship("Opportunity", cascade="all, delete", back_populates="user")
     tasks = db.relationship("Task", cascade="all, delete", back_populates="user")
     materials = db.relationship(
@@ -54,19 +453,24 @@ class Opportunity(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     org_name = db.Column(db.String(255), nullable=False)
     title = db.Column(db.String(255), nullable=False)
-    app_deadline = db.Column(db.String(255))
-    personal_deadline = db.Column(db.String(255))
+    app_deadline = db.Column(db.Date)
+    personal_deadline = db.Column(db.Date)
     requirements = db.Column(db.Text)
     link = db.Column(db.String(255))
     short_description = db.Column(db.TEXT)
-    category = db.Column(db.String(255))
+    # active_history loads the replaced value of a /stats column on edit, see
+    # track_stat_deltas
+    category = db.column_property(db.Column(db.String(255)), active_history=True)
     priority = db.Column(db.Integer, default=0)
-    status = db.Column(db.String(255), default="Haven't Started")
+    status = db.column_property(
+        db.Column(db.String(255), default="Haven't Started"), active_history=True
+    )
     notes = db.Column(db.Text)
     other_info = db.Column(db.Text)
     contact_info = db.Column(db.Text)
     location = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
     user_id = db.Column(db.Integer, db.ForeignKey(User.id), nullable=False)
     user = db.relationship("User", back_populates="opps")
     materials = db.relationship(
@@ -76,6 +480,21 @@ class Opportunity(db.Model):
     applications = db.relationship(
         "Application_History", cascade="all, delete", back_populates="opps"
     )
+    reminders = db.relationship("Reminder", cascade="all, delete")
+    __table_args__ = (
+        # unsorted dashboard pages run in (user_id, id) order
+        db.Index("ix_opportunity_user_id", "user_id"),
+        db.Index("ix_opportunity_user_status", "user_id", "status"),
+        db.Index("ix_opportunity_user_category", "user_id", "category"),
+        db.Index("ix_opportunity_user_app_deadline", "user_id", "app_deadline"),
+        db.Index(
+            "ix_opportunity_user_personal_deadline", "user_id", "personal_deadline"
+        ),
+        db.Index("ix_opportunity_user_updated_at", "user_id", "updated_at"),
+        # the reminder scheduler scans deadlines across every user
+        db.Index("ix_opportunity_app_deadline", "app_deadline"),
+        db.Index("ix_opportunity_personal_deadline", "personal_deadline"),
+    )
 
 
 class Task(db.Model):
@@ -83,10 +502,17 @@ class Task(db.Model):
     description = db.Column(db.String(255), nullable=False)
     opp_id = db.Column(db.Integer, db.ForeignKey(Opportunity.id), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey(User.id), nullable=False)
-    status = db.Column(db.String(255), default="Not done")
+    status = db.column_property(
+        db.Column(db.String(255), default="Not done"), active_history=True
+    )
     created_at = db.Column(db.DateTime, default=db.func.utcnow)
     user = db.relationship("User", back_populates="tasks")
     opps = db.relationship("Opportunity", back_populates="tasks")
+    __table_args__ = (
+        db.Index("ix_task_user_id", "user_id", "id"),
+        db.Index("ix_task_user_status", "user_id", "status"),
+        db.Index("ix_task_opp_user", "opp_id", "user_id"),
+    )
 
 
 class Material(db.Model):
@@ -98,6 +524,11 @@ class Material(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.now)
     user = db.relationship("User", back_populates="materials")
     opps = db.relationship("Opportunity", back_populates="materials")
+    __table_args__ = (
+        db.Index("ix_material_user_opp", "user_id", "opp_id"),
+        db.Index("ix_material_opp_id", "opp_id"),
+        db.Index("ix_material_file", "file"),
+    )
 
 
 class Link(db.Model):
@@ -107,37 +538,64 @@ class Link(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey(User.id), nullable=False)
     created_at = db.Column(db.DateTime, default=db.func.utcnow)
     user = db.relationship("User", back_populates="links")
+    __table_args__ = (db.Index("ix_link_user_id", "user_id"),)
 
 
 class Application_History(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    application_date = db.Column(db.Date, default=date.today())
+    application_date = db.column_property(
+        db.Column(db.Date, default=date.today()), active_history=True
+    )
     opp_id = db.Column(db.Integer, db.ForeignKey(Opportunity.id), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey(User.id), nullable=False)
     created_at = db.Column(db.DateTime, default=db.func.utcnow)
     user = db.relationship("User", back_populates="applications")
     opps = db.relationship("Opportunity", back_populates="applications")
+    __table_args__ = (
+        db.Index("ix_application__history_user_opp", "user_id", "opp_id"),
+        db.Index("ix_application__history_opp_id", "opp_id"),
+    )
 
 
-@app.route("/", methods=["GET", "POST"])
-@login_required
-def index():
-    status = request.form.get("status")
-    category = request.form.get("category")
-    sort_by = request.form.get("sort")
+class UserStat(db.Model):
+    """One per-user counter behind /stats, kept current by every write"""
 
-    query = Opportunity.query
-    if sort_by == "app_deadline":
-        query = query.filter(Opportunity.user_id == session["user_id"]).order_by(
-            Opportunity.app_deadline.desc()
-        )
-    elif sort_by == "personal_deadline":
-        query = query.filter(Opportunity.user_id == session["user_id"]).order_by(
-            Opportunity.personal_deadline.desc()
-        )
+    user_id = db.Column(db.Integer, db.ForeignKey(User.id), primary_key=True)
+    kind = db.Column(db.String(32), primary_key=True)
+    key = db.Column(db.String(255), primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
 
-    else:
-        query = query.filter(Opportunity.user_id == session["user_id"])
+
+class Reminder(db.Model):
+    """A deadline reminder; unique per deadline and window so it is sent once"""
+
+    id = db.Column(db.Integer, primary_key=True)
+    opp_id = db.Column(db.Integer, db.ForeignKey(Opportunity.id), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey(User.id), nullable=False)
+    field = db.Column(db.String(32), nullable=False)
+    deadline = db.Column(db.Date, nullable=False)
+    window_days = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.now)
+    sent_at = db.Column(db.DateTime)
+    __table_args__ = (
+        db.UniqueConstraint(
+            "opp_id", "field", "deadline", "window_days", name="uq_reminder_window"
+        ),
+        db.Index("ix_reminder_sent_at", "sent_at"),
+    )
+
+
+def opportunity_query(
+    user_id, status=None, category=None, sort_by=None, due_after=None, due_before=None
+):
+    """Build the dashboard query so every filter hits a (user_id, ...) index"""
+    query = Opportunity.query.filter(Opportunity.user_id == user_id)
+
+    # deadline ranges are inclusive and run on the (user_id, app_deadline) index
+    if due_after:
+        query = query.filter(Opportunity.app_deadline >= due_after)
+    if due_before:
+        query = query.filter(Opportunity.app_deadline <= due_before)
 
     if status and status != "all":
         query = query.filter(Opportunity.status == status)
@@ -145,9 +603,245 @@ def index():
     if category and category != "all":
         query = query.filter(Opportunity.category == category)
 
-    opportunities = query.all()
+    if sort_by == "app_deadline":
+        query = query.order_by(Opportunity.app_deadline.desc())
+    elif sort_by == "personal_deadline":
+        query = query.order_by(Opportunity.personal_deadline.desc())
+
+    return query
+
+
+SORT_COLUMNS = {
+    "app_deadline": Opportunity.app_deadline,
+    "personal_deadline": Opportunity.personal_deadline,
+}
+
+
+def page_size():
+    """Page size from ?per_page=, clamped to MAX_PAGE_SIZE"""
+    size = request.args.get("per_page", type=int) or app.config["PAGE_SIZE"]
+    return max(1, min(size, app.config["MAX_PAGE_SIZE"]))
+
+
+def deadline_range(due):
+    """Map a deadline filter name to an inclusive (start, end) date range"""
+    today = date.today()
+    if due == "upcoming":
+        return today, today + timedelta(days=app.config["DEADLINE_WINDOW_DAYS"])
+    if due == "overdue":
+        return None, today - timedelta(days=1)
+    return None, None
+
+
+@event.listens_for(db.session, "after_flush")
+def track_written_users(session, flush_context):
+    # remember whose rows this transaction touched, dropped from cache on commit
+    users = session.info.setdefault("written_users", set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, User):
+            users.add(obj.id)
+        elif getattr(obj, "user_id", None) is not None:
+            users.add(int(obj.user_id))
+
+
+@event.listens_for(db.session, "after_commit")
+def invalidate_written_users(session):
+    for user_id in session.info.pop("written_users", ()):
+        cache.invalidate(user_id)
+
+
+@event.listens_for(db.session, "after_rollback")
+def forget_written_users(session):
+    session.info.pop("written_users", None)
+    session.info.pop("released_blobs", None)
+    session.info.pop("stat_deltas", None)
+
+
+# the columns each model's counters depend on, and the (kind, key) counters a
+# row with those values counts towards
+STAT_SOURCES = {
+    Opportunity: (
+        ("status", "category"),
+        lambda row: [
+            ("status", row.get("status") or ""),
+            ("category", row.get("category") or ""),
+        ],
+    ),
+    Task: (
+        ("status",),
+        lambda row: [("tasks", "total")]
+        + ([("tasks", "done")] if row.get("status") == "Done" else []),
+    ),
+    Application_History: (
+        ("application_date",),
+        lambda row: (
+            [("applied", row["application_date"].strftime("%Y-%m"))]
+            if row.get("application_date")
+            else []
+        ),
+    ),
+}
+
+
+def record_stats(session, model, user_id, rows, sign=1):
+    """Count rows written without the ORM, e.g. bulk inserts, towards /stats"""
+    deltas = session.info.setdefault("stat_deltas", Counter())
+    counters = STAT_SOURCES[model][1]
+    for row in rows:
+        for kind, key in counters(row):
+            deltas[(int(user_id), kind, key)] += sign
+
+
+@event.listens_for(db.session, "after_flush")
+def track_stat_deltas(session, flush_context):
+    # inserts and deletes move counters by one; an edit moves its old
+    # values' counters down and its new values' up
+    for objects, sign in ((session.new, 1), (session.deleted, -1)):
+        for obj in objects:
+            if type(obj) in STAT_SOURCES:
+                columns = STAT_SOURCES[type(obj)][0]
+                row = {column: getattr(obj, column) for column in columns}
+                record_stats(session, type(obj), obj.user_id, [row], sign)
+    for obj in session.dirty:
+        if type(obj) not in STAT_SOURCES:
+            continue
+        state = db.inspect(obj)
+        columns = STAT_SOURCES[type(obj)][0]
+        histories = {column: state.attrs[column].history for column in columns}
+        if not any(history.has_changes() for history in histories.values()):
+            continue
+        old = {
+            column: history.deleted[0] if history.deleted else getattr(obj, column)
+            for column, history in histories.items()
+        }
+        new = {column: getattr(obj, column) for column in columns}
+        record_stats(session, type(obj), obj.user_id, [old], -1)
+        record_stats(session, type(obj), obj.user_id, [new])
+
+
+@event.listens_for(db.session, "before_commit")
+def write_stat_deltas(session):
+    # flush first so the last changes are counted, then apply every delta in
+    # the transaction that made them
+    session.flush()
+    deltas = session.info.pop("stat_deltas", None)
+    rows = [
+        {"user_id": user_id, "kind": kind, "key": key, "count": delta}
+        for (user_id, kind, key), delta in (deltas or {}).items()
+        if delta
+    ]
+    if rows:
+        insert = sqlite_insert(UserStat)
+        session.connection().execute(
+            insert.on_conflict_do_update(
+                index_elements=["user_id", "kind", "key"],
+                set_={"count": UserStat.count + insert.excluded.count},
+            ),
+            rows,
+        )
+
+
+@event.listens_for(db.session, "after_flush")
+def track_released_blobs(session, flush_context):
+    # blobs a deleted or re-uploaded material pointed at, checked on commit
+    blobs = session.info.setdefault("released_blobs", set())
+    for obj in session.deleted:
+        if isinstance(obj, Material):
+            blobs.add(obj.file)
+    for obj in session.dirty:
+        if isinstance(obj, Material):
+            blobs.update(db.inspect(obj).attrs.file.history.deleted)
+
+
+@event.listens_for(db.session, "after_commit")
+def delete_unreferenced_blobs(session):
+    blobs = session.info.pop("released_blobs", None)
+    if not blobs:
+        return
+    # the session can't run SQL after commit, count on a connection of our own
+    with db.engine.connect() as conn:
+        referenced = set(
+            conn.scalars(db.select(Material.file).where(Material.file.in_(blobs)))
+        )
+    cutoff = time.time() - app.config["BLOB_GC_GRACE_SECONDS"]
+    for key in blobs - referenced:
+        if not storage.exists(key):
+            # rows from before content-addressed storage, or seeded ones
+            continue
+        if storage.modified(key) > cutoff:
+            # just uploaded again, maybe for a row not committed yet; the
+            # run-scheduler sweep collects it once the grace period is over
+            continue
+        remove_blob(key)
+
+
+def remove_blob(key):
+    """Delete a blob with its derived files and job records"""
+    storage.delete(key)
+    jobs.forget(key)
+    for kind in MATERIAL_JOBS:
+        try:
+            os.remove(derived_path(kind, key))
+        except FileNotFoundError:
+            pass
+
+
+def row_dict(obj):
+    """Column values of a model instance, safe to cache and share between requests"""
+    if obj is None:
+        return None
+    return {column.key: getattr(obj, column.key) for column in obj.__table__.columns}
+
+
+@app.route("/", methods=["GET", "POST"])
+@login_required
+def index():
+    # filters come from the form on POST and from the page links on GET
+    filters = {
+        name: request.values.get(name)
+        for name in ("status", "category", "sort", "due", "per_page")
+        if request.values.get(name)
+    }
+    after, before, size = (
+        request.args.get("after"),
+        request.args.get("before"),
+        page_size(),
+    )
+
+    def load():
+        due_after, due_before = deadline_range(filters.get("due"))
+        sort_column = SORT_COLUMNS.get(filters.get("sort"))
+        query = opportunity_query(
+            session["user_id"],
+            status=filters.get("status"),
+            category=filters.get("category"),
+            due_after=due_after,
+            due_before=due_before,
+        )
+        rows, next_cursor, prev_cursor = keyset_page(
+            query,
+            Opportunity.id,
+            sort_column=sort_column,
+            descending=sort_column is not None,
+            after=after,
+            before=before,
+            page_size=size,
+        )
+        return [row_dict(row) for row in rows], next_cursor, prev_cursor
 
-    return render_template("index.html", opps=opportunities)
+    # the date is part of the key because the deadline filters are relative
+    key = f"index:{date.today()}:{sorted(filters.items())}:{after}:{before}:{size}"
+    opportunities, next_cursor, prev_cursor = cache.get_or_set(
+        session["user_id"], key, load
+    )
+
+    return render_template(
+        "index.html",
+        opps=opportunities,
+        filters=filters,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+    )
 
 
 @app.route("/apply", methods=["POST"])
@@ -174,12 +868,18 @@ def apply():
 @login_required
 def add():
     if request.method == "POST":
+        # a deadline that isn't a date is rejected, as it is on edit
+        try:
+            app_deadline = parse_deadline(request.form.get("app_deadline"))
+            personal_deadline = parse_deadline(request.form.get("personal_deadline"))
+        except ValueError:
+            abort(400)
         # add to table op
         new_opp = Opportunity(
             org_name=request.form.get("org_name"),
             title=request.form.get("title"),
-            app_deadline=request.form.get("app_deadline"),
-            personal_deadline=request.form.get("personal_deadline"),
+            app_deadline=app_deadline,
+            personal_deadline=personal_deadline,
             requirements=request.form.get("requirements"),
             category=request.form.get("category"),
             link=request.form.get("link"),
@@ -193,65 +893,540 @@ def add():
             created_at=datetime.now(),
             user_id=session["user_id"],
         )
-        db.session.add(new_opp)
-        db.session.commit()
-        if new_opp.status == "Applied":
-            application = Application_History(
-                opp_id=request.form.get("opp_id"),
-                user_id=session["user_id"],
-                application_date=datetime.now(),
-                created_at=datetime.now(),
-            )
-            db.session.add(application)
-            db.session.commit()
-        value = request.form.get("tasks")
-        tasks = value.split(",")
-        for task in tasks:
-            task = task.strip().capitalize()
-            new_task = Task(
-                user_id=session["user_id"],
-                opp_id=new_opp.id,
-                description=task,
-                created_at=datetime.now(),
-            )
-            db.session.add(new_task)
+        descriptions = [
+            task.strip().capitalize()
+            for task in (request.form.get("tasks") or "").split(",")
+            if task.strip()
+        ]
+        # one transaction for the opportunity, its history row and its tasks
+        with timed("add"):
+            db.session.add(new_opp)
+            # flush to get new_opp.id for the rows that reference it
+            db.session.flush()
+            if new_opp.status == "Applied":
+                db.session.add(
+                    Application_History(
+                        opp_id=new_opp.id,
+                        user_id=session["user_id"],
+                        application_date=datetime.now(),
+                        created_at=datetime.now(),
+                    )
+                )
+            if descriptions:
+                tasks = [
+                    {
+                        "user_id": session["user_id"],
+                        "opp_id": new_opp.id,
+                        "description": description,
+                        "created_at": datetime.now(),
+                    }
+                    for description in descriptions
+                ]
+                db.session.execute(db.insert(Task), tasks)
+                record_stats(db.session, Task, session["user_id"], tasks)
             db.session.commit()
 
-        # task logic
-
         return redirect("/")
     return render_template("addOp.html")
 
 
+# columns an import may set; everything else is owned by the app
+# set by the server; skipped on import so an export can be imported again
+SERVER_COLUMNS = {"id", "user_id", "created_at", "updated_at"}
+IMPORT_COLUMNS = {
+    column.key: column
+    for column in Opportunity.__table__.columns
+    if column.key not in SERVER_COLUMNS
+}
+
+
+def validate_opportunity(record):
+    """
+    Check one imported record against the Opportunity columns.
+
+    Returns (values, task descriptions) or raises ValueError naming the
+    first problem. tasks may be a comma-separated string or a list.
+    """
+    if isinstance(record, Exception):
+        raise record
+    unknown = set(record) - set(IMPORT_COLUMNS) - SERVER_COLUMNS - {"tasks"}
+    if unknown:
+        raise ValueError("unknown column(s): " + ", ".join(sorted(map(str, unknown))))
+
+    values = {}
+    for name, column in IMPORT_COLUMNS.items():
+        value = record.get(name)
+        if isinstance(value, str):
+            value = value.strip()
+        if value is None or value == "":
+            if not column.nullable:
+                raise ValueError(f"{name} is required")
+            continue
+        python_type = column.type.python_type
+        if python_type is date:
+            parsed = parse_date(str(value))
+            if parsed is None:
+                raise ValueError(f"{name} is not a date: {value!r}")
+            value = parsed
+        elif python_type is int:
+            # int() would store true as 1 and truncate 2.7 to 2
+            if isinstance(value, bool) or (
+                isinstance(value, float) and not value.is_integer()
+            ):
+                raise ValueError(f"{name} is not a whole number: {value!r}")
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{name} is not a number: {value!r}")
+        else:
+            value = str(value)
+            length = getattr(column.type, "length", None)
+            if length and len(value) > length:
+                raise ValueError(f"{name} is longer than {length} characters")
+        values[name] = value
+
+    tasks = record.get("tasks") or []
+    if isinstance(tasks, str):
+        tasks = tasks.split(",")
+    tasks = [str(task).strip().capitalize() for task in tasks if str(task).strip()]
+    return values, tasks
+
+
+def insert_opportunity_batch(user_id, batch):
+    """Insert validated (values, tasks) pairs and their tasks in one transaction"""
+    now = datetime.now()
+    opps = [
+        Opportunity(user_id=user_id, created_at=now, **values) for values, _ in batch
+    ]
+    db.session.add_all(opps)
+    db.session.flush()
+    tasks = [
+        {"user_id": user_id, "opp_id": opp.id, "description": task, "created_at": now}
+        for opp, (_, descriptions) in zip(opps, batch)
+        for task in descriptions
+    ]
+    if tasks:
+        db.session.execute(db.insert(Task), tasks)
+        record_stats(db.session, Task, user_id, tasks)
+    applications = [
+        {
+            "user_id": user_id,
+            "opp_id": opp.id,
+            "application_date": now.date(),
+            "created_at": now,
+        }
+        for opp in opps
+        if opp.status == "Applied"
+    ]
+    if applications:
+        db.session.execute(db.insert(Application_History), applications)
+        record_stats(db.session, Application_History, user_id, applications)
+    db.session.commit()
+    return len(opps)
+
+
+def import_opportunities(user_id, records, batch_size=None):
+    """
+    Validate and insert a stream of records, committing every batch_size rows.
+
+    Returns a summary with row counts, per-row errors (up to
+    MAX_IMPORT_ERRORS) and throughput. A stream that can't be decoded stops
+    the import; batches committed before that point are kept.
+    """
+    batch_size = batch_size or app.config["IMPORT_BATCH_SIZE"]
+    summary = {"rows": 0, "imported": 0, "failed": 0, "errors": []}
+    started = time.perf_counter()
+    batch = []
+    try:
+        for row, record in enumerate(records, start=1):
+            summary["rows"] = row
+            try:
+                batch.append(validate_opportunity(record))
+            except ValueError as e:
+                summary["failed"] += 1
+                if len(summary["errors"]) < app.config["MAX_IMPORT_ERRORS"]:
+                    summary["errors"].append({"row": row, "error": str(e)})
+                continue
+            if len(batch) >= batch_size:
+                summary["imported"] += insert_opportunity_batch(user_id, batch)
+                batch = []
+    except (UnicodeDecodeError, csv.Error) as e:
+        summary["aborted"] = f"row {summary['rows'] + 1}: {e}"
+    if batch:
+        summary["imported"] += insert_opportunity_batch(user_id, batch)
+    elapsed = time.perf_counter() - started
+    summary["seconds"] = round(elapsed, 3)
+    summary["rows_per_second"] = round(summary["rows"] / elapsed, 1) if elapsed else 0
+    return summary
+
+
+@app.route("/import", methods=["POST"])
+@login_required
+def import_opps():
+    uploaded_file = request.files.get("file")
+    if not uploaded_file:
+        return jsonify({"error": "no file uploaded"}), 400
+    fmt = record_format(uploaded_file.filename, request.form.get("format"))
+    if fmt not in ("csv", "ndjson"):
+        return jsonify({"error": "file must be .csv or .ndjson"}), 400
+    summary = import_opportunities(
+        session["user_id"],
+        iter_records(uploaded_file.stream, fmt),
+        request.form.get("batch_size", type=int),
+    )
+    # nothing usable in the file is the client's error
+    if summary["failed"] and not summary["imported"]:
+        return jsonify(summary), 400
+    return jsonify(summary)
+
+
 @app.route("/calendar")
 @login_required
 def calendar():
-    # send the events as list of dictionaries
-    # title, startDate, color
-    # title, app_deadline AND #title, personal_deadline
-    opps = db.session.execute(
-        text(
-            "SELECT title, org_name, app_deadline, personal_deadline FROM Opportunity WHERE user_id = :user_id"
-        ),
-        {"user_id": session["user_id"]},
-    )
+    # events are fetched per visible range from /calendar/events
+    return render_template("calendar.html")
+
+
+# one event per deadline column and the colour it is drawn in
+DEADLINE_EVENTS = {
+    "app_deadline": "red",
+    "personal_deadline": "blue",
+}
+
+
+def deadline_events(user_id, start, end):
+    """Calendar events for deadlines in [start, end), one indexed range query each"""
     events = []
-    for opp in opps:
-        # val 1 and 2 are dicts
-        val1 = {}
-        val2 = {}
-        # disect array to include title, app_deadline, color AND  title, personal_deadline, color
-        # then append all into the new array
-        val2["title"] = val1["title"] = opp.title + ", " + opp.org_name
-        val1["start"] = opp.app_deadline
-        val1["color"] = "red"
-        val2["start"] = opp.personal_deadline
-        val2["color"] = "blue"
-        events.append(val1)
-        events.append(val2)
-        # append to the array
-
-    return render_template("calendar.html", events=events)
+    for field, color in DEADLINE_EVENTS.items():
+        column = getattr(Opportunity, field)
+        rows = db.session.execute(
+            db.select(Opportunity.id, Opportunity.title, Opportunity.org_name, column)
+            .where(
+                (Opportunity.user_id == user_id) & (column >= start) & (column < end)
+            )
+            .order_by(column)
+        )
+        for row in rows:
+            events.append(
+                {
+                    "id": f"{row.id}-{field}",
+                    "title": row.title + ", " + row.org_name,
+                    "start": row[3].isoformat(),
+                    "allDay": True,
+                    "color": color,
+                    "url": f"/view/{row.id}",
+                }
+            )
+    return events
+
+
+@app.route("/calendar/events")
+@login_required
+def calendar_events():
+    # FullCalendar sends ISO 8601 timestamps, only the date part matters here
+    try:
+        start = date.fromisoformat(request.args["start"][:10])
+        end = date.fromisoformat(request.args["end"][:10])
+    except (KeyError, ValueError):
+        abort(400)
+    if end <= start or (end - start).days > app.config["MAX_CALENDAR_WINDOW_DAYS"]:
+        abort(400)
+    return jsonify(deadline_events(session["user_id"], start, end))
+
+
+EXPORTS = {
+    "opportunities": Opportunity,
+    "tasks": Task,
+    "materials": Material,
+    "history": Application_History,
+}
+
+
+def export_rows(model, user_id):
+    """Column names and a server-side cursor over one of a user's tables"""
+    columns = [column for column in model.__table__.columns if column.key != "user_id"]
+    statement = (
+        db.select(*columns)
+        .where(model.user_id == user_id)
+        .order_by(model.id)
+        .execution_options(yield_per=app.config["EXPORT_CHUNK_SIZE"])
+    )
+    return [column.key for column in columns], db.session.execute(statement)
+
+
+@app.route("/export/<kind>.<fmt>")
+@login_required
+def export(kind, fmt):
+    if fmt not in ("csv", "ndjson") or (kind not in EXPORTS and kind != "all"):
+        abort(404)
+    if kind == "all" and fmt == "csv":
+        # the tables have different columns, so only NDJSON can mix them
+        abort(404)
+    user_id = session["user_id"]
+
+    def generate():
+        if kind == "all":
+            for name, model in EXPORTS.items():
+                yield from ndjson_lines(*export_rows(model, user_id), type=name)
+        elif fmt == "csv":
+            yield from csv_lines(*export_rows(EXPORTS[kind], user_id))
+        else:
+            yield from ndjson_lines(*export_rows(EXPORTS[kind], user_id))
+
+    mimetype = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    return Response(
+        stream_with_context(generate()),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f"attachment; filename={kind}.{fmt}"},
+    )
+
+
+def local_to_utc(value):
+    """updated_at holds naive local time (datetime.now); make it aware UTC"""
+    return value.astimezone(timezone.utc)
+
+
+def feed_validators(user_id):
+    """
+    ETag and Last-Modified for a user's deadline feed.
+
+    Both come from the (user_id, updated_at) index without reading any
+    opportunity rows: edits and inserts move the latest updated_at and
+    deletes change the count. The ETag keeps microseconds so two edits in
+    the same second differ; Last-Modified is whole seconds in UTC.
+    """
+    count, latest = db.session.execute(
+        db.select(db.func.count(), db.func.max(Opportunity.updated_at)).where(
+            Opportunity.user_id == user_id
+        )
+    ).one()
+    etag = hashlib.sha256(
+        f"ics-v2:{user_id}:{count}:{latest.isoformat() if latest else ''}".encode()
+    ).hexdigest()[:32]
+    last_modified = (
+        local_to_utc(latest) if latest else datetime(1970, 1, 1, tzinfo=timezone.utc)
+    )
+    return etag, last_modified.replace(microsecond=0)
+
+
+@app.route("/calendar/<token>.ics")
+def calendar_feed(token):
+    user = User.query.filter_by(feed_token=token).first()
+    if user is None:
+        abort(404)
+    etag, last_modified = feed_validators(user.id)
+
+    # answer unchanged polls before touching the opportunities at all
+    if request.if_none_match:
+        # weak comparison, the compressed feed is sent with a weak ETag
+        not_modified = request.if_none_match.contains_weak(etag)
+    else:
+        since = request.if_modified_since
+        not_modified = since is not None and last_modified <= since
+    if not_modified:
+        response = Response(status=304)
+    else:
+        opps = db.session.execute(
+            db.select(
+                Opportunity.id,
+                Opportunity.title,
+                Opportunity.org_name,
+                Opportunity.app_deadline,
+                Opportunity.personal_deadline,
+                Opportunity.updated_at,
+            ).where(Opportunity.user_id == user.id)
+        )
+        events = []
+        for opp in opps:
+            for field, label in (
+                ("app_deadline", "Application deadline"),
+                ("personal_deadline", "Personal deadline"),
+            ):
+                if getattr(opp, field):
+                    events.append(
+                        {
+                            "uid": f"{opp.id}-{field}@app-tracker",
+                            "date": getattr(opp, field),
+                            "summary": f"{label}: {opp.title}, {opp.org_name}",
+                            "stamp": (
+                                local_to_utc(opp.updated_at)
+                                if opp.updated_at
+                                else last_modified
+                            ),
+                        }
+                    )
+        response = Response(ical_calendar(events), mimetype="text/calendar")
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+@app.route("/calendar/feed", methods=["POST"])
+@login_required
+def reset_calendar_feed():
+    # a new token revokes every subscription made with the old one
+    user = db.session.get(User, session["user_id"])
+    user.feed_token = secrets.token_urlsafe(32)
+    db.session.commit()
+    return redirect("/profile")
+
+
+def ops_only(f):
+    """Restrict a route to clients sending OPS_TOKEN as a bearer token"""
+
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        token = app.config["OPS_TOKEN"]
+        if not token:
+            abort(404)
+        if not secrets.compare_digest(
+            request.headers.get("Authorization", ""), f"Bearer {token}"
+        ):
+            abort(403)
+        return f(*args, **kwargs)
+
+    return decorated_function
+
+
+@app.route("/metrics")
+@ops_only
+def metrics_endpoint():
+    stats = cache.stats()
+    body = metrics.render(
+        extra=[
+            ("app_cache_hits_total", "counter", "Read cache hits.", stats["hits"]),
+            (
+                "app_cache_misses_total",
+                "counter",
+                "Read cache misses.",
+                stats["misses"],
+            ),
+        ]
+    )
+    return Response(body, mimetype="text/plain; version=0.0.4")
+
+
+@app.route("/cache/stats")
+@ops_only
+def cache_stats():
+    return jsonify(cache.stats())
+
+
+# bm25 weights in opportunity_fts column order, user_id is not searchable
+SEARCH_WEIGHTS = (0, 10.0, 5.0, 2.0, 2.0, 1.0, 1.0)
+
+
+def search_opportunities(user_id, query, limit, offset):
+    """
+    Best-ranked matches for an FTS5 query among a user's opportunities.
+
+    The full-text index drives the query: MATCH runs once and each hit is
+    looked up by primary key, which is far cheaper than probing the index
+    again for every row the user owns.
+    """
+    statement = text(
+        "SELECT opportunity.id, opportunity.title, opportunity.org_name, "
+        "opportunity.status, opportunity.app_deadline, "
+        "highlight(opportunity_fts, 1, :start, :end) AS title_highlight, "
+        "snippet(opportunity_fts, -1, :start, :end, '…', 16) AS snippet "
+        "FROM opportunity_fts JOIN opportunity "
+        "ON opportunity.id = opportunity_fts.rowid "
+        "WHERE opportunity_fts MATCH :query AND opportunity.user_id = :user_id "
+        "ORDER BY bm25(opportunity_fts, {}) LIMIT :limit OFFSET :offset".format(
+            ", ".join(map(str, SEARCH_WEIGHTS))
+        )
+    ).columns(app_deadline=db.Date)
+    rows = db.session.execute(
+        statement,
+        {
+            "start": HIGHLIGHT_START,
+            "end": HIGHLIGHT_END,
+            "query": query,
+            "user_id": user_id,
+            "limit": limit,
+            "offset": offset,
+        },
+    )
+    return [row._asdict() for row in rows]
+
+
+@app.route("/search")
+@login_required
+def search():
+    q = request.args.get("q", "").strip()
+    page = max(1, request.args.get("page", 1, type=int))
+    size = page_size()
+    query = fts_query(q)
+
+    def load():
+        # one extra row tells whether there is a next page
+        return search_opportunities(
+            session["user_id"], query, size + 1, (page - 1) * size
+        )
+
+    results = (
+        cache.get_or_set(session["user_id"], f"search:{query}:{page}:{size}", load)
+        if query
+        else []
+    )
+    has_next = len(results) > size
+    results = [
+        dict(
+            result,
+            title_highlight=highlight_markup(result["title_highlight"]),
+            snippet=highlight_markup(result["snippet"]),
+        )
+        for result in results[:size]
+    ]
+    if request.accept_mimetypes.best == "application/json":
+        # ISO dates, as /api/* sends them
+        return jsonify(
+            results=[
+                dict(
+                    result,
+                    app_deadline=result["app_deadline"]
+                    and result["app_deadline"].isoformat(),
+                )
+                for result in results
+            ],
+            page=page,
+            has_next=has_next,
+        )
+    return render_template(
+        "search.html", q=q, results=results, page=page, has_next=has_next
+    )
+
+
+@app.route("/stats")
+@login_required
+def stats():
+    def load():
+        # only the summary rows, never the tables they count
+        summary = {"status": {}, "category": {}, "applied": {}, "tasks": {}}
+        for kind, key, count in db.session.execute(
+            db.select(UserStat.kind, UserStat.key, UserStat.count).where(
+                (UserStat.user_id == session["user_id"]) & (UserStat.count != 0)
+            )
+        ):
+            summary.setdefault(kind, {})[key] = count
+        return summary
+
+    summary = cache.get_or_set(session["user_id"], "stats", load)
+    total, done = summary["tasks"].get("total", 0), summary["tasks"].get("done", 0)
+    data = {
+        "status": summary["status"],
+        "category": summary["category"],
+        "applications_per_month": dict(sorted(summary["applied"].items())),
+        "tasks": {
+            "total": total,
+            "done": done,
+            "completion_rate": round(done / total, 3) if total else None,
+        },
+    }
+    if request.accept_mimetypes.best == "application/json":
+        return jsonify(data)
+    return render_template("stats.html", stats=data)
 
 
 @app.route("/history")
@@ -341,25 +1516,105 @@ def materials():
     # add material to table
     uploaded_file = request.files["file"]
     if uploaded_file:
-        if (
-            uploaded_file.filename.rsplit(".", 1)[1].lower()
-            not in app.config["UPLOAD_EXTENSIONS"]
-        ):
-            return "Invalid file extension."
+        try:
+            key = storage.save(uploaded_file.stream, uploaded_file.filename)
+        except InvalidUpload as e:
+            return str(e), 400
 
-        uploaded_file.save("files")
         new_material = Material(
             user_id=session["user_id"],
             opp_id=request.form.get("id"),
-            file="files/" + uploaded_file.filename,
+            file=key,
             title=request.form.get("title"),
             created_at=datetime.now(),
         )
         db.session.add(new_material)
         db.session.commit()
+        enqueue_material_jobs(key)
     return redirect("/")
 
 
+def owned_material(id):
+    material = Material.query.filter_by(id=id, user_id=session["user_id"]).first()
+    if material is None or not storage.exists(material.file):
+        abort(404)
+    return material
+
+
+@app.route("/material/<int:id>/download")
+@login_required
+def download_material(id):
+    material = owned_material(id)
+    digest, extension = os.path.splitext(material.file)
+    options = {
+        "mimetype": mimetypes.guess_type(material.file)[0]
+        or "application/octet-stream",
+        "as_attachment": True,
+        "download_name": material.title + extension,
+        # the content hash is a strong validator, repeat downloads get a 304
+        "etag": digest,
+    }
+    accel = app.config["UPLOAD_ACCEL_REDIRECT"]
+    if accel:
+        # nginx sends the bytes and answers Range itself, the app only checks
+        # ownership and the ETag
+        response = werkzeug.utils.send_file(
+            storage.path(material.file),
+            request.environ,
+            use_x_sendfile=True,
+            conditional=False,
+            response_class=app.response_class,
+            **options,
+        )
+        del response.headers["X-Sendfile"]
+        del response.headers["Content-Length"]
+        response.headers["X-Accel-Redirect"] = (
+            accel.rstrip("/") + "/" + storage.relpath(material.file)
+        )
+        response = response.make_conditional(request)
+        if response.status_code == 304:
+            # nginx would otherwise follow the redirect and send the file
+            del response.headers["X-Accel-Redirect"]
+    else:
+        # send_file answers If-None-Match and Range, and hands the file to
+        # the server's wsgi.file_wrapper (sendfile) when it has one
+        response = send_file(storage.path(material.file), **options)
+    response.cache_control.private = True
+    return response
+
+
+@app.route("/material/<int:id>/status")
+@login_required
+def material_status(id):
+    material = owned_material(id)
+    statuses = {}
+    for kind in material_jobs(material.file):
+        job = jobs.status(kind, material.file)
+        if job is None:
+            # uploaded before jobs existed, or the queue file was reset
+            enqueue_material_jobs(material.file)
+            job = ("queued", None)
+        status, error = job
+        statuses[kind] = {"status": status, "error": error}
+        if status == "done":
+            statuses[kind]["url"] = url_for("material_result", id=id, kind=kind)
+    return jsonify(statuses)
+
+
+@app.route("/material/<int:id>/<any(thumbnail, text):kind>")
+@login_required
+def material_result(id, kind):
+    material = owned_material(id)
+    path = derived_path(kind, material.file)
+    if not os.path.isfile(path):
+        abort(404)
+    return send_file(
+        path,
+        mimetype="image/png" if kind == "thumbnail" else "text/plain",
+        etag=os.path.splitext(material.file)[0] + "-" + kind,
+    )
+
+
 @app.route("/notes")
 @login_required
 def notes():
@@ -371,9 +1626,30 @@ def notes():
 @login_required
 def profile():
     # send current user's profile
-    user = User.query.filter_by(id=session["user_id"]).first()
-    links = Link.query.filter_by(user_id=session["user_id"]).all()
-    materials = Material.query.filter_by(user_id=session["user_id"]).all()
+    def load():
+        # only what the page shows: the password hash and feed token stay out
+        # of the cache file
+        user = db.session.execute(
+            db.select(User.name, User.email, User.username).where(
+                User.id == session["user_id"]
+            )
+        ).one()
+        links = Link.query.filter_by(user_id=session["user_id"]).all()
+        materials = Material.query.filter_by(user_id=session["user_id"]).all()
+        return (
+            user._asdict(),
+            list(map(row_dict, links)),
+            list(map(row_dict, materials)),
+        )
+
+    user, links, materials = cache.get_or_set(session["user_id"], "profile", load)
+    # the feed link is a credential, so it is read fresh on every view
+    user = dict(
+        user,
+        feed_token=db.session.execute(
+            db.select(User.feed_token).where(User.id == session["user_id"])
+        ).scalar(),
+    )
 
     return render_template("profile.html", materials=materials, links=links, user=user)
 
@@ -429,130 +1705,364 @@ def add_tasks():
     # add opportunity names to before sending
 
 
+# canonical task statuses, the model default is "Not done"
+TASK_STATUSES = {"done": "Done", "not done": "Not done", "not_done": "Not done"}
+
+
+def task_query(user_id, status=None, opp_id=None, created_from=None, created_to=None):
+    """A user's tasks with their opportunity titles, every filter optional"""
+    query = (
+        db.session.query(
+            Task.id,
+            Task.opp_id,
+            Task.description,
+            Task.status,
+            Task.created_at,
+            Opportunity.title,
+        )
+        .join(Opportunity, Task.opp_id == Opportunity.id)
+        .filter(Task.user_id == user_id)
+    )
+    if status:
+        # every row is "Done" or "Not done", so this seeks ix_task_user_status
+        query = query.filter(Task.status == status)
+    if opp_id is not None:
+        query = query.filter(Task.opp_id == opp_id)
+    if created_from:
+        query = query.filter(Task.created_at >= created_from)
+    if created_to:
+        # inclusive of the whole last day
+        query = query.filter(Task.created_at < created_to + timedelta(days=1))
+    return query
+
+
+def task_filters(values):
+    """task_query arguments from request values; a bad one aborts with 400"""
+    filters = {}
+    status = (values.get("status") or values.get("filter") or "").lower()
+    if status and status != "all":
+        if status not in TASK_STATUSES:
+            abort(400)
+        filters["status"] = TASK_STATUSES[status]
+    try:
+        if values.get("opp_id"):
+            filters["opp_id"] = int(values["opp_id"])
+        for name in ("created_from", "created_to"):
+            if values.get(name):
+                filters[name] = date.fromisoformat(values[name])
+    except ValueError:
+        abort(400)
+    return filters
+
+
+def task_dict(row):
+    return {
+        "id": row.id,
+        "opp_id": row.opp_id,
+        "title": row.title,
+        "description": row.description,
+        "status": row.status,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+    }
+
+
 @app.route("/tasks", methods=["GET", "POST"])
 @login_required
 def tasks():
-    filter_option = request.form.get("filter")
-    if filter_option == "done":
-        tasks = db.session.execute(
-            text(
-                "SELECT Opportunity.title, Task.description, Task.status, Task.opp_id FROM Task JOIN Opportunity ON Task.opp_id = Opportunity.id WHERE Task.user_id = :user_id AND Task.status = 'Done'"
-            ),
-            {"user_id": session["user_id"]},
-        )
-    elif filter_option == "not done":
-        tasks = db.session.execute(
-            text(
-                "SELECT Opportunity.title, Task.description, Task.status, Task.opp_id FROM Task JOIN Opportunity ON Task.opp_id = Opportunity.id WHERE Task.user_id = :user_id AND Task.status = 'Not Done'"
-            ),
-            {"user_id": session["user_id"]},
-        )
+    filters = task_filters(request.values)
+    rows, next_cursor, prev_cursor = keyset_page(
+        task_query(session["user_id"], **filters),
+        Task.id,
+        after=request.args.get("after"),
+        before=request.args.get("before"),
+        page_size=page_size(),
+    )
+    return render_template(
+        "tasks.html",
+        tasks=rows,
+        # carried through the Previous/Next links
+        filters={
+            name: request.values[name]
+            for name in ("filter", "status", "opp_id", "created_from", "created_to")
+            if request.values.get(name)
+        },
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+    )
+
+
+@app.route("/api/tasks")
+@login_required
+def api_tasks():
+    rows, next_cursor, prev_cursor = keyset_page(
+        task_query(session["user_id"], **task_filters(request.args)),
+        Task.id,
+        after=request.args.get("after"),
+        before=request.args.get("before"),
+        page_size=page_size(),
+    )
+    return jsonify(
+        tasks=[task_dict(row) for row in rows], next=next_cursor, prev=prev_cursor
+    )
+
+
+@app.route("/api/tasks/status", methods=["POST"])
+@login_required
+def api_tasks_status():
+    """Set the status of many tasks in one statement: {"ids": [...], "status": ...}"""
+    body = request.get_json(silent=True) or {}
+    ids, status = body.get("ids"), TASK_STATUSES.get(str(body.get("status")).lower())
+    if (
+        status is None
+        or not isinstance(ids, list)
+        or not all(isinstance(id, int) for id in ids)
+    ):
+        abort(400)
+    if len(ids) > app.config["MAX_PAGE_SIZE"] * 5:
+        abort(413)
+    user_id = session["user_id"]
+    # only rows whose done-ness flips, so the count is also the stats delta
+    if status == "Done":
+        flips = Task.status == "Not done"
+        old = {"status": "Not done"}
     else:
-        # add opportunity names to before sending
-        tasks = db.session.execute(
-            text(
-                "SELECT Opportunity.title, Task.description, Task.status, Task.opp_id FROM Task JOIN Opportunity ON Task.opp_id = Opportunity.id WHERE Task.user_id = :user_id"
-            ),
-            {"user_id": session["user_id"]},
+        flips = Task.status == "Done"
+        old = {"status": "Done"}
+    changed = (
+        db.session.connection()
+        .execute(
+            db.update(Task)
+            .where((Task.user_id == user_id) & Task.id.in_(ids) & flips)
+            .values(status=status)
         )
-    return render_template("tasks.html", tasks=tasks)
+        .rowcount
+    )
+    # a Core update bypasses the ORM events, so report the change ourselves
+    if changed:
+        db.session.info.setdefault("written_users", set()).add(user_id)
+        record_stats(db.session, Task, user_id, [old] * changed, -1)
+        record_stats(db.session, Task, user_id, [{"status": status}] * changed)
+    db.session.commit()
+    return jsonify(updated=changed)
+
+
+def owned(model, id):
+    """The current user's row of model with this id, or a 404"""
+    return model.query.filter_by(id=id, user_id=session["user_id"]).first_or_404()
+
+
+def api_row(obj):
+    """row_dict with ISO dates, which is what a fetch() caller can use"""
+    return {
+        key: value.isoformat() if isinstance(value, (date, datetime)) else value
+        for key, value in row_dict(obj).items()
+    }
+
+
+def json_body():
+    """The request's JSON object, or a 400"""
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        abort(400)
+    return body
 
 
 @app.route("/update_status", methods=["POST"])
+@login_required
 def update_status():
-    id = request.form.get("id")
-    status = request.form.get("status")
+    task = owned(Task, request.form.get("id"))
+    task.status = "Done" if request.form.get("status") == "true" else "Not done"
+    db.session.commit()
+    return redirect(f"/view/{task.opp_id}")
 
-    task = Task.query.get_or_404(id)
-    task.status = "Done" if status == "true" else "Not Done"
 
+@app.route("/api/tasks/<int:id>", methods=["PATCH"])
+@login_required
+def api_task(id):
+    task = owned(Task, id)
+    status = TASK_STATUSES.get(str(json_body().get("status")).lower())
+    if status is None:
+        abort(400)
+    task.status = status
     db.session.commit()
-    return redirect("/")
+    return jsonify(api_row(task))
+
+
+def load_opportunity(user_id, opp_id):
+    """
+    Load an opportunity with its tasks, materials and applied flag in two queries.
+
+    Tasks are joined eagerly and materials fetched by a second SELECT ... IN,
+    since joining both sibling collections would return tasks x materials
+    rows. The history check is a correlated EXISTS, so nothing is lazy-loaded
+    afterwards. Returns (opportunity, applied), or (None, False) if the user
+    doesn't own it.
+    """
+    applied = (
+        db.select(Application_History.id)
+        .where(
+            (Application_History.opp_id == Opportunity.id)
+            & (Application_History.user_id == user_id)
+        )
+        .exists()
+    )
+    row = (
+        db.session.execute(
+            db.select(Opportunity, applied)
+            .options(joinedload(Opportunity.tasks), selectinload(Opportunity.materials))
+            .where((Opportunity.user_id == user_id) & (Opportunity.id == opp_id))
+        )
+        .unique()
+        .one_or_none()
+    )
+    return (row[0], row[1]) if row else (None, False)
 
 
 # make this based on id
 @app.route("/view/<int:opp_id>")
 @login_required
 def view(opp_id):
-    opp = Opportunity.query.filter(
-        (Opportunity.user_id == session["user_id"]) & (Opportunity.id == opp_id)
-    ).first()
-    tasks = Task.query.filter(
-        (Task.user_id == session["user_id"]) & (Task.opp_id == opp_id)
-    ).all()
-    materials = Material.query.filter(
-        (Material.user_id == session["user_id"]) & (Material.opp_id == opp_id)
-    ).all()
+    def load():
+        opp, applied = load_opportunity(session["user_id"], opp_id)
+        if opp is None:
+            return None, [], [], False
+        return (
+            row_dict(opp),
+            [row_dict(task) for task in sorted(opp.tasks, key=attrgetter("id"))],
+            [row_dict(m) for m in sorted(opp.materials, key=attrgetter("id"))],
+            applied,
+        )
 
-    if Application_History.query.filter(
-        (Application_History.user_id == session["user_id"])
-        & (Application_History.opp_id == opp_id)
-    ).first():
-        applied = True
-    else:
-        applied = False
+    opp, tasks, materials, applied = cache.get_or_set(
+        session["user_id"], f"view:{opp_id}", load
+    )
     # send the data corresponding to op: op, tasks, materials,
     return render_template(
         "viewOp.html", opp=opp, tasks=tasks, materials=materials, applied=applied
     )
 
 
+def parse_deadline(value):
+    # parse_date turns garbage into None, which would silently clear the date
+    parsed = parse_date(value)
+    if parsed is None and value and value.strip():
+        raise ValueError(f"not a date: {value!r}")
+    return parsed
+
+
+def parse_priority(value):
+    # the view draws one star per point, so blank means none rather than NULL
+    return int(value or 0)
+
+
+# the columns a form or a PATCH may change, and how to read each one
+OPPORTUNITY_FIELDS = {
+    "org_name": str,
+    "title": str,
+    "app_deadline": parse_deadline,
+    "personal_deadline": parse_deadline,
+    "requirements": str,
+    "category": str,
+    "link": str,
+    "short_description": str,
+    "priority": parse_priority,
+    "status": str,
+    "notes": str,
+    "other_info": str,
+    "contact_info": str,
+    "location": str,
+}
+LINK_FIELDS = {"title": str, "link": str}
+MATERIAL_FIELDS = {"title": str}
+
+
+def update_fields(obj, fields, values):
+    """
+    Set the fields present in values on obj, leaving the rest alone.
+
+    A value that can't be parsed, or a blank one for a NOT NULL column,
+    aborts with 400 before anything is changed.
+    """
+    changes = {}
+    for name, parse in fields.items():
+        if name not in values:
+            continue
+        value = values[name]
+        if value is not None:
+            # bool is an int, but {"priority": true} is a client bug
+            if isinstance(value, bool) or not isinstance(value, (str, int)):
+                abort(400)
+            try:
+                value = parse(value)
+            except (AttributeError, ValueError):
+                abort(400)
+        if value in (None, "") and not obj.__table__.columns[name].nullable:
+            abort(400)
+        changes[name] = value
+    for name, value in changes.items():
+        setattr(obj, name, value)
+
+
+def update_opportunity(op, values):
+    was_applied = op.status == "Applied"
+    update_fields(op, OPPORTUNITY_FIELDS, values)
+    if op.status == "Applied" and not was_applied:
+        db.session.add(
+            Application_History(
+                opp_id=op.id,
+                user_id=op.user_id,
+                application_date=datetime.now(),
+                created_at=datetime.now(),
+            )
+        )
+    db.session.commit()
+
+
 # task(POST), material(POST), op(GET, POST), user (GET, POST), link(POST), history(GET)
 @app.route("/op/edit/<int:id>", methods=["POST"])
 @login_required
 def update_op(id):
-    op = Opportunity.query.get_or_404(id)
-    op.org_name = (request.form.get("org_name"),)
-    op.title = (request.form.get("title"),)
-    op.app_deadline = (request.form.get("app_deadline"),)
-    op.personal_deadline = (request.form.get("personal_deadline"),)
-    op.requirements = (request.form.get("requirements"),)
-    op.category = (request.form.get("category"),)
-    op.link = (request.form.get("link"),)
-    op.short_description = (request.form.get("short_description"),)
-    op.priority = (request.form.get("priority"),)
-    op.status = (request.form.get("status"),)
-    op.notes = (request.form.get("notes"),)
-    op.other_info = (request.form.get("other_info"),)
-    op.contact_info = (request.form.get("contact_info"),)
-    op.location = (request.form.get("location"),)
-    db.session.commit()
-    if op.status == "Applied":
-        application = Application_History(
-            opp_id=id,
-            user_id=session["user_id"],
-            application_date=datetime.now(),
-            created_at=datetime.now(),
-        )
-        db.session.add(application)
-        db.session.commit()
-    return redirect("/")
+    update_opportunity(owned(Opportunity, id), request.form)
+    return redirect(f"/view/{id}")
 
 
 @app.route("/link/edit", methods=["POST"])
 @login_required
 def edit_link():
-    id = request.form.get("id")
-    link = Link.query.get_or_404(id)
-    link.title = request.form.get("edit_title")
-    link.link = request.form.get("edit_link")
+    link = owned(Link, request.form.get("id"))
+    update_fields(
+        link,
+        LINK_FIELDS,
+        {
+            "title": request.form.get("edit_title"),
+            "link": request.form.get("edit_link"),
+        },
+    )
     db.session.commit()
-    return redirect("/")
+    return redirect("/profile")
 
 
 @app.route("/material/edit", methods=["POST"])
 @login_required
 def edit_material():
-    id = request.form.get("id")
-    material = Material.query.get_or_404(id)
-    material.title = request.form.get("edit_file_title")
-    if request.form.get("file"):
-        material.file = request.form.get("file")
+    material = owned(Material, request.form.get("id"))
+    update_fields(
+        material, MATERIAL_FIELDS, {"title": request.form.get("edit_file_title")}
+    )
+    uploaded_file = request.files.get("file")
+    if uploaded_file:
+        try:
+            material.file = storage.save(uploaded_file.stream, uploaded_file.filename)
+        except InvalidUpload as e:
+            return str(e), 400
     db.session.commit()
-    return redirect("/")
+    if uploaded_file:
+        enqueue_material_jobs(material.file)
+    return redirect("/profile")
 
 
 @app.route("/edit", methods=["POST"])
+@login_required
 def edit_profile():
     user = User.query.get_or_404(session["user_id"])
     user.name = request.form.get("name")
@@ -563,24 +2073,952 @@ def edit_profile():
 
 
 @app.route("/op/<int:id>/delete", methods=["POST"])
+@login_required
 def delete_op(id):
-    op = Opportunity.query.get_or_404(id)
-    db.session.delete(op)
+    db.session.delete(owned(Opportunity, id))
     db.session.commit()
     return redirect("/")
 
 
 @app.route("/material/<int:id>/delete", methods=["POST"])
+@login_required
 def delete_material(id):
-    op = Material.query.get_or_404(id)
-    db.session.delete(op)
+    db.session.delete(owned(Material, id))
     db.session.commit()
-    return redirect("/")
+    return redirect("/profile")
 
 
 @app.route("/link/<int:id>/delete", methods=["POST"])
+@login_required
 def delete_link(id):
-    op = Link.query.get_or_404(id)
-    db.session.delete(op)
+    db.session.delete(owned(Link, id))
     db.session.commit()
-    return redirect("/")
+    return redirect("/profile")
+
+
+# JSON counterparts of the form routes above: a PATCH answers with the
+# changed row and a DELETE with 204, so the page updates in place instead
+# of re-rendering after a redirect
+API_MODELS = {
+    "opportunities": (Opportunity, OPPORTUNITY_FIELDS),
+    "links": (Link, LINK_FIELDS),
+    "materials": (Material, MATERIAL_FIELDS),
+}
+
+
+@app.route(
+    "/api/<any(opportunities, links, materials):kind>/<int:id>",
+    methods=["PATCH", "DELETE"],
+)
+@login_required
+def api_item(kind, id):
+    model, fields = API_MODELS[kind]
+    obj = owned(model, id)
+    if request.method == "DELETE":
+        db.session.delete(obj)
+        db.session.commit()
+        return "", 204
+    if model is Opportunity:
+        update_opportunity(obj, json_body())
+    else:
+        update_fields(obj, fields, json_body())
+        db.session.commit()
+    return jsonify(api_row(obj))
+
+
+def explain(statement):
+    """Return SQLite's query plan for a statement as a list of detail lines"""
+    if hasattr(statement, "statement"):
+        statement = statement.statement
+    # render_postcompile expands IN lists into one placeholder per value
+    compiled = statement.compile(
+        dialect=db.engine.dialect, compile_kwargs={"render_postcompile": True}
+    )
+    params = compiled.construct_params()
+    args = tuple(params[name] for name in compiled.positiontup or ())
+    with db.engine.connect() as conn:
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + str(compiled), args)
+        return [row[-1] for row in rows]
+
+
+@app.cli.command("explain-queries")
+@click.option("--user-id", default=1, show_default=True)
+def explain_queries(user_id):
+    """Print the query plan of every route query and fail on full table scans"""
+    plans = {
+        "index": opportunity_query(user_id),
+        "index?status": opportunity_query(user_id, status="Applied"),
+        "index?category": opportunity_query(user_id, category="Job"),
+        "index?sort=app_deadline": opportunity_query(user_id, sort_by="app_deadline"),
+        "index?sort=personal_deadline": opportunity_query(
+            user_id, sort_by="personal_deadline"
+        ),
+        "index?due=upcoming": opportunity_query(
+            user_id, due_after=date.today(), due_before=date.today()
+        ),
+        # the statements keyset_page actually runs for a page past a cursor
+        "index?after": keyset_query(
+            opportunity_query(user_id), Opportunity.id, position=(None, 1)
+        ),
+        "index?sort=app_deadline&after": keyset_query(
+            opportunity_query(user_id),
+            Opportunity.id,
+            Opportunity.app_deadline,
+            descending=True,
+            position=(date.today(), 1),
+        ),
+        "index?sort=personal_deadline&after": keyset_query(
+            opportunity_query(user_id),
+            Opportunity.id,
+            Opportunity.personal_deadline,
+            descending=True,
+            position=(date.today(), 1),
+        ),
+        "index?sort=app_deadline&before": keyset_query(
+            opportunity_query(user_id),
+            Opportunity.id,
+            Opportunity.app_deadline,
+            position=(date.today(), 1),
+        ),
+        # past the last dated row, among the undated ones
+        "index?sort=app_deadline&after=undated": keyset_query(
+            opportunity_query(user_id),
+            Opportunity.id,
+            Opportunity.app_deadline,
+            descending=True,
+            position=(None, 1),
+        ),
+        "view:tasks": Task.query.filter((Task.user_id == user_id) & (Task.opp_id == 1)),
+        "view:materials": Material.query.filter(
+            (Material.user_id == user_id) & (Material.opp_id == 1)
+        ),
+        "view:applied": Application_History.query.filter(
+            (Application_History.user_id == user_id) & (Application_History.opp_id == 1)
+        ),
+        # the pages /tasks and /api/tasks fetch, all ordered by task id
+        "tasks": keyset_query(task_query(user_id), Task.id),
+        "tasks?status=done": keyset_query(task_query(user_id, "Done"), Task.id),
+        "tasks?status=not_done": keyset_query(task_query(user_id, "Not done"), Task.id),
+        "tasks?after": keyset_query(task_query(user_id), Task.id, position=(None, 1)),
+        "history": db.select(Opportunity.title, Application_History.application_date)
+        .join(Opportunity, Application_History.opp_id == Opportunity.id)
+        .where(Application_History.user_id == user_id),
+        "profile:links": Link.query.filter_by(user_id=user_id),
+        "profile:materials": Material.query.filter_by(user_id=user_id),
+        "calendar/events:app_deadline": db.select(Opportunity.title).where(
+            (Opportunity.user_id == user_id)
+            & (Opportunity.app_deadline >= date.today())
+            & (Opportunity.app_deadline < date.today() + timedelta(days=42))
+        ),
+        "calendar/events:personal_deadline": db.select(Opportunity.title).where(
+            (Opportunity.user_id == user_id)
+            & (Opportunity.personal_deadline >= date.today())
+            & (Opportunity.personal_deadline < date.today() + timedelta(days=42))
+        ),
+        "run-scheduler:app_deadline": due_soon_query("app_deadline", date.today()),
+        "run-scheduler:personal_deadline": due_soon_query(
+            "personal_deadline", date.today()
+        ),
+        "run-scheduler:pending": db.select(Reminder.id).where(
+            Reminder.sent_at.is_(None)
+        ),
+    }
+    scans = rescans = 0
+    for route, statement in plans.items():
+        click.echo(route)
+        details = explain(statement)
+        for detail in details:
+            click.echo("    " + detail)
+            # a bare "SCAN <table>" means no index was usable for the lookup
+            if detail.startswith("SCAN ") and " USING " not in detail:
+                scans += 1
+        # a page past a cursor has to seek to it, or deep pages rescan the
+        # rows before it and get slower the further they are
+        if ("after" in route or "before" in route) and not any(
+            detail.startswith("SEARCH ") and ("<?" in detail or ">?" in detail)
+            for detail in details
+        ):
+            click.echo("    cursor not used to seek")
+            rescans += 1
+    if scans or rescans:
+        raise click.ClickException(
+            f"{scans} full table scan(s) and {rescans} unseekable cursor(s) found"
+        )
+
+
+@app.cli.command("import-opps")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--user-id", type=int, required=True)
+@click.option("--format", "fmt", type=click.Choice(["csv", "ndjson"]))
+@click.option("--batch-size", type=int, help="Rows per transaction.")
+def import_opps_command(path, user_id, fmt, batch_size):
+    """Stream opportunities from a CSV or NDJSON file into a user's tracker"""
+    if db.session.get(User, user_id) is None:
+        raise click.ClickException(f"no user with id {user_id}")
+    fmt = record_format(path, fmt)
+    if fmt not in ("csv", "ndjson"):
+        raise click.ClickException(
+            "use --format for files without a .csv/.ndjson extension"
+        )
+    with open(path, "rb") as f:
+        summary = import_opportunities(user_id, iter_records(f, fmt), batch_size)
+    for error in summary["errors"]:
+        click.echo(f"row {error['row']}: {error['error']}", err=True)
+    if "aborted" in summary:
+        click.echo(f"aborted at {summary['aborted']}", err=True)
+    click.echo(
+        f"imported {summary['imported']} of {summary['rows']} rows "
+        f"({summary['failed']} failed) in {summary['seconds']}s, "
+        f"{summary['rows_per_second']} rows/sec"
+    )
+
+
+# FullCalendar view name prefixes and the plugin that provides them
+FULLCALENDAR_VIEWS = {
+    "dayGrid": "daygrid",
+    "timeGrid": "timegrid",
+    "list": "list",
+    "multiMonth": "multimonth",
+}
+
+
+def fullcalendar_usage():
+    """Plugins and locales referenced by the templates' FullCalendar options"""
+    plugins, locales = {"core"}, set()
+    for name in os.listdir(app.template_folder):
+        with open(os.path.join(app.template_folder, name), encoding="utf-8") as f:
+            source = f.read()
+        if "FullCalendar" not in source:
+            continue
+        for prefix, plugin in FULLCALENDAR_VIEWS.items():
+            if re.search(r"\b" + prefix + r"[A-Z]\w*", source):
+                plugins.add(plugin)
+        if re.search(r"\b(selectable|editable|dateClick)\b", source):
+            plugins.add("interaction")
+        locales.update(re.findall(r"\blocale:\s*[\"']([\w-]+)[\"']", source))
+    # core must load first, every plugin registers itself with it
+    return ["core"] + sorted(plugins - {"core"}), sorted(locales)
+
+
+@app.cli.command("build-assets")
+def build_assets():
+    """Bundle the FullCalendar plugins the templates use and precompress it"""
+    plugins, locales = fullcalendar_usage()
+    source = os.path.join(app.static_folder, app.config["FULLCALENDAR_DIR"])
+    parts = [os.path.join(source, plugin, "index.global.min.js") for plugin in plugins]
+    parts += [
+        os.path.join(source, "core", "locales", f"{locale}.global.min.js")
+        for locale in locales
+    ]
+    build = os.path.join(app.static_folder, app.config["ASSET_BUILD_DIR"])
+    os.makedirs(build, exist_ok=True)
+    bundle = os.path.join(build, "fullcalendar.min.js")
+    with open(bundle, "wb") as out:
+        for part in parts:
+            with open(part, "rb") as f:
+                out.write(f.read().rstrip() + b"\n;\n")
+    click.echo(
+        f"plugins: {', '.join(plugins)}; locales: {', '.join(locales) or 'none'}"
+    )
+    for path in [bundle] + precompress(bundle):
+        click.echo(
+            f"{os.path.relpath(path, app.static_folder)}: {os.path.getsize(path)} bytes"
+        )
+
+
+SEED_STATUSES = ["Haven't Started", "In Progress", "Applied", "Rejected", "Accepted"]
+SEED_CATEGORIES = ["Job", "Internship", "Scholarship", "Fellowship", "Competition"]
+
+
+@app.cli.command("seed")
+@click.option("--users", default=10, show_default=True)
+@click.option("--opps-per-user", default=100, show_default=True)
+@click.option("--tasks-per-opp", default=3, show_default=True)
+@click.option("--materials-per-opp", default=1, show_default=True)
+@click.option("--password", default="benchmark", show_default=True)
+@click.option("--seed", "random_seed", default=0, show_default=True)
+def seed(users, opps_per_user, tasks_per_opp, materials_per_opp, password, random_seed):
+    """Fill the database with synthetic users named bench1, bench2, ..."""
+    rng = random.Random(random_seed)
+    # one hash for every user, hashing is deliberately slow
+    password = generate_password_hash(password)
+    first = User.query.filter(User.username.like("bench%")).count() + 1
+    next_opp_id = (db.session.scalar(db.select(db.func.max(Opportunity.id))) or 0) + 1
+    now, today = datetime.now(), date.today()
+    started = time.perf_counter()
+    for n in range(first, first + users):
+        user = User(
+            name=f"Bench User {n}",
+            email=f"bench{n}@example.com",
+            username=f"bench{n}",
+            password=password,
+            created_at=now,
+            feed_token=secrets.token_urlsafe(32),
+        )
+        db.session.add(user)
+        db.session.flush()
+        batch_size = app.config["IMPORT_BATCH_SIZE"]
+        for offset in range(0, opps_per_user, batch_size):
+            opps, tasks, materials, applications = [], [], [], []
+            for i in range(offset, min(offset + batch_size, opps_per_user)):
+                deadline = today + timedelta(days=rng.randint(-90, 180))
+                status = rng.choice(SEED_STATUSES)
+                opps.append(
+                    {
+                        "id": next_opp_id,
+                        "user_id": user.id,
+                        "org_name": f"Organisation {rng.randint(1, 500)}",
+                        "title": f"Opportunity {i + 1}",
+                        "app_deadline": deadline,
+                        "personal_deadline": deadline
+                        - timedelta(days=rng.randint(1, 14)),
+                        "requirements": "CV, cover letter, two references",
+                        "category": rng.choice(SEED_CATEGORIES),
+                        "priority": rng.randint(0, 3),
+                        "status": status,
+                        "notes": f"Synthetic opportunity seeded with {random_seed}",
+                        "other_info": f"source: seed, batch: {offset // batch_size}",
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+                tasks += [
+                    {
+                        "user_id": user.id,
+                        "opp_id": next_opp_id,
+                        "description": f"Task {t + 1}",
+                        "status": rng.choice(["Done", "Not done"]),
+                        "created_at": now,
+                    }
+                    for t in range(tasks_per_opp)
+                ]
+                materials += [
+                    {
+                        "user_id": user.id,
+                        "opp_id": next_opp_id,
+                        "title": f"Material {m + 1}",
+                        "file": f"seed-{next_opp_id}-{m + 1}.pdf",
+                        "created_at": now,
+                    }
+                    for m in range(materials_per_opp)
+                ]
+                if status == "Applied":
+                    applications.append(
+                        {
+                            "user_id": user.id,
+                            "opp_id": next_opp_id,
+                            "application_date": deadline - timedelta(days=7),
+                            "created_at": now,
+                        }
+                    )
+                next_opp_id += 1
+            for model, rows in (
+                (Opportunity, opps),
+                (Task, tasks),
+                (Material, materials),
+                (Application_History, applications),
+            ):
+                if rows:
+                    db.session.execute(db.insert(model), rows)
+                    if model in STAT_SOURCES:
+                        record_stats(db.session, model, user.id, rows)
+        db.session.commit()
+    click.echo(
+        f"seeded users bench{first}..bench{first + users - 1} with "
+        f"{opps_per_user} opportunities each in "
+        f"{time.perf_counter() - started:.1f}s"
+    )
+
+
+def benchmark_requests(user_id):
+    """(name, method, url, form) for every route, using one of the user's rows"""
+    opp_id = db.session.scalar(
+        db.select(Opportunity.id).where(Opportunity.user_id == user_id).limit(1)
+    )
+    task_id = db.session.scalar(
+        db.select(Task.id).where(Task.user_id == user_id).limit(1)
+    )
+    token = db.session.get(User, user_id).feed_token
+    today = date.today()
+    window = (
+        f"start={today.replace(day=1)}&end={today.replace(day=1) + timedelta(days=42)}"
+    )
+
+    def halfway(*columns):
+        # the row halfway down the user's rows in this order: a cursor deep
+        # enough that its page has to seek rather than read from the start
+        model = columns[0].class_
+        count = db.session.scalar(
+            db.select(db.func.count())
+            .select_from(model)
+            .where(model.user_id == user_id)
+        )
+        return db.session.execute(
+            db.select(*columns)
+            .where(model.user_id == user_id)
+            .order_by(*[column.desc() for column in columns])
+            .offset(count // 2)
+            .limit(1)
+        ).first()
+
+    middle = halfway(Opportunity.app_deadline, Opportunity.id)
+    index_after = encode_cursor(*middle) if middle else ""
+    middle = halfway(Task.id)
+    tasks_after = encode_cursor(None, middle.id) if middle else ""
+    return [
+        ("index", "GET", "/", None),
+        ("index?status", "GET", "/?status=Applied", None),
+        ("index?sort", "GET", "/?sort=app_deadline", None),
+        ("index?sort&after", "GET", f"/?sort=app_deadline&after={index_after}", None),
+        ("index?due", "GET", "/?due=upcoming", None),
+        ("view", "GET", f"/view/{opp_id}", None),
+        ("tasks", "GET", "/tasks", None),
+        ("tasks?done", "POST", "/tasks", {"filter": "done"}),
+        ("tasks?after", "GET", f"/tasks?after={tasks_after}", None),
+        ("api/tasks", "GET", "/api/tasks", None),
+        ("api/tasks?not_done", "GET", "/api/tasks?status=not_done", None),
+        ("api/tasks?done", "GET", "/api/tasks?status=done", None),
+        ("search", "GET", "/search?q=organisation+42", None),
+        # a term in every seeded title: the most ranking work
+        ("search?broad", "GET", "/search?q=opportunity", None),
+        ("stats", "GET", "/stats", None),
+        ("history", "GET", "/history", None),
+        ("profile", "GET", "/profile", None),
+        ("notes", "GET", "/notes", None),
+        ("calendar", "GET", "/calendar", None),
+        ("calendar/events", "GET", f"/calendar/events?{window}", None),
+        ("calendar.ics", "GET", f"/calendar/{token}.ics", None),
+        ("export", "GET", "/export/opportunities.csv", None),
+        ("add", "POST", "/add", {"org_name": "Bench", "title": "Added", "tasks": "a"}),
+        ("update_status", "POST", "/update_status", {"id": task_id, "status": "true"}),
+    ]
+
+
+def time_routes(clients, iterations):
+    """Per-route latency summaries, round-robin over (client, requests) pairs"""
+    results = {}
+    everything, total_elapsed = [], 0
+    for i, (name, method, _, _) in enumerate(clients[0][1]):
+        latencies, errors = [], 0
+        started = time.perf_counter()
+        for iteration in range(iterations):
+            client, requests = clients[iteration % len(clients)]
+            _, _, url, form = requests[i]
+            request_started = time.perf_counter()
+            response = client.open(url, method=method, data=form)
+            response.get_data()
+            latencies.append(time.perf_counter() - request_started)
+            response.close()
+            errors += response.status_code >= 400
+        elapsed = time.perf_counter() - started
+        results[name] = latency_summary(latencies, elapsed)
+        results[name]["errors"] = errors
+        everything += latencies
+        total_elapsed += elapsed
+    return results, everything, total_elapsed
+
+
+@app.cli.command("benchmark")
+@click.option(
+    "--users",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="Seeded users to use.",
+)
+@click.option(
+    "--iterations",
+    type=click.IntRange(min=1),
+    default=50,
+    show_default=True,
+    help="Requests per route.",
+)
+@click.option("--password", default="benchmark", show_default=True)
+@click.option(
+    "--output", type=click.Path(dir_okay=False), help="Write results as JSON."
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Earlier JSON results to compare against.",
+)
+def benchmark(users, iterations, password, output, baseline):
+    """
+    Time every route through the test client, round-robin over seeded users.
+
+    Run 'flask seed' first. Reports p50/p95/p99 latency and throughput per
+    route; set CACHE_BACKEND=null to measure without the read cache. The
+    opportunities the write routes add and the task statuses they flip are
+    undone afterwards, so every run starts from the same data.
+    """
+    clients, user_ids = [], []
+    for n in range(1, users + 1):
+        client = app.test_client()
+        client.post("/login", data={"username": f"bench{n}", "password": password})
+        with client.session_transaction() as client_session:
+            user_id = client_session.get("user_id")
+        if user_id is None:
+            raise click.ClickException(f"can't log in as bench{n}, run 'flask seed'")
+        clients.append((client, benchmark_requests(user_id)))
+        user_ids.append(user_id)
+
+    # what the write routes change, to put back once the run is over
+    last_opp_id = db.session.scalar(db.select(db.func.max(Opportunity.id))) or 0
+    task_ids = [
+        form["id"]
+        for _, requests in clients
+        for name, _, _, form in requests
+        if name == "update_status"
+    ]
+    statuses = dict(
+        db.session.execute(
+            db.select(Task.id, Task.status).where(Task.id.in_(task_ids))
+        ).all()
+    )
+    try:
+        results, everything, total_elapsed = time_routes(clients, iterations)
+    finally:
+        db.session.rollback()
+        for opp in Opportunity.query.filter(
+            Opportunity.user_id.in_(user_ids) & (Opportunity.id > last_opp_id)
+        ):
+            db.session.delete(opp)
+        for task in Task.query.filter(Task.id.in_(statuses)):
+            task.status = statuses[task.id]
+        db.session.commit()
+
+    report = {
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "database": db.engine.url.render_as_string(hide_password=True),
+        "cache": type(cache).__name__,
+        "users": users,
+        "iterations": iterations,
+        "routes": results,
+        "total": latency_summary(everything, total_elapsed),
+    }
+    previous = {}
+    if baseline:
+        with open(baseline) as f:
+            previous = json.load(f)
+        previous = {**previous["routes"], "total": previous["total"]}
+    for name, summary in {**results, "total": report["total"]}.items():
+        line = (
+            f"{name:20} p50 {summary['p50_ms']:8.2f}ms  p95 {summary['p95_ms']:8.2f}ms"
+            f"  p99 {summary['p99_ms']:8.2f}ms  {summary['requests_per_second']:8.1f}/s"
+        )
+        if name in previous:
+            change = summary["p95_ms"] / previous[name]["p95_ms"] - 1
+            line += f"  p95 {change:+.0%} vs baseline"
+        if summary.get("errors"):
+            line += f"  {summary['errors']} errors"
+        click.echo(line)
+    if output:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+        click.echo(f"results written to {output}")
+
+
+# "before" settings for benchmark-sqlite: SQLite's defaults with a rollback
+# journal, which has to be set explicitly since WAL persists in the file
+SQLITE_DEFAULT_PRAGMAS = {"journal_mode": "delete", "synchronous": "full"}
+
+
+def sqlite_benchmark_worker(uri, pragmas, ids, seconds, write_ratio, seed, results):
+    """One worker process: mixed dashboard reads and task writes for `seconds`"""
+    engine = create_engine(uri)
+    rng = random.Random(seed)
+    apply_sqlite_pragmas(engine, pragmas)
+    reads, writes, locked = [], [], 0
+    deadline = time.perf_counter() + seconds
+    with engine.connect() as conn:
+        while time.perf_counter() < deadline:
+            user_id, task_id = rng.choice(ids)
+            started = time.perf_counter()
+            try:
+                if rng.random() < write_ratio:
+                    conn.execute(
+                        db.update(Task)
+                        .where(Task.id == task_id)
+                        .values(status=rng.choice(["Done", "Not done"]))
+                    )
+                    conn.commit()
+                    writes.append(time.perf_counter() - started)
+                else:
+                    conn.execute(
+                        db.select(Opportunity.__table__)
+                        .where(Opportunity.user_id == user_id)
+                        .order_by(Opportunity.id)
+                        .limit(app.config["PAGE_SIZE"])
+                    ).all()
+                    conn.commit()
+                    reads.append(time.perf_counter() - started)
+            except OperationalError as e:
+                conn.rollback()
+                if "locked" not in str(e):
+                    raise
+                locked += 1
+    engine.dispose()
+    results.put((reads, writes, locked))
+
+
+@app.cli.command("benchmark-sqlite")
+@click.option("--workers", default=8, show_default=True, help="Worker processes.")
+@click.option("--seconds", default=5.0, show_default=True, help="Per profile.")
+@click.option("--write-ratio", default=0.2, show_default=True)
+@click.option(
+    "--output", type=click.Path(dir_okay=False), help="Write results as JSON."
+)
+def benchmark_sqlite(workers, seconds, write_ratio, output):
+    """
+    Compare SQLite's default settings with SQLITE_PRAGMAS under concurrency.
+
+    Worker processes, like gunicorn's, each read dashboard pages and update
+    task statuses on their own connection. Run 'flask seed' first; the
+    database is left in the SQLITE_PRAGMAS journal mode.
+    """
+    if db.engine.dialect.name != "sqlite":
+        raise click.ClickException("benchmark-sqlite needs a SQLite DATABASE_URL")
+    ids = db.session.execute(db.select(Task.user_id, Task.id).limit(10000)).all()
+    if not ids:
+        raise click.ClickException("no tasks to update, run 'flask seed' first")
+    ids = [tuple(row) for row in ids]
+    db.session.remove()
+    db.engine.dispose()
+    uri = db.engine.url.render_as_string(hide_password=False)
+    context = multiprocessing.get_context("fork")
+    report = {"workers": workers, "seconds": seconds, "write_ratio": write_ratio}
+    for profile, pragmas in (
+        ("default", SQLITE_DEFAULT_PRAGMAS),
+        ("production", app.config["SQLITE_PRAGMAS"]),
+    ):
+        results = context.Queue()
+        processes = [
+            context.Process(
+                target=sqlite_benchmark_worker,
+                args=(uri, pragmas, ids, seconds, write_ratio, n, results),
+            )
+            for n in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        reads, writes, locked = [], [], 0
+        for _ in processes:
+            worker_reads, worker_writes, worker_locked = results.get()
+            reads += worker_reads
+            writes += worker_writes
+            locked += worker_locked
+        for process in processes:
+            process.join()
+        report[profile] = {
+            "pragmas": pragmas,
+            "reads": latency_summary(reads, seconds),
+            "writes": latency_summary(writes, seconds),
+            "locked_errors": locked,
+        }
+        for kind in ("reads", "writes"):
+            summary = report[profile][kind]
+            click.echo(
+                f"{profile:10} {kind:6} {summary['requests']:7} ops "
+                f"{summary['requests_per_second'] or 0:9.1f}/s  "
+                f"p50 {summary.get('p50_ms', 0):7.2f}ms  "
+                f"p99 {summary.get('p99_ms', 0):8.2f}ms"
+            )
+        click.echo(f"{profile:10} 'database is locked' errors: {locked}")
+    if output:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+        click.echo(f"results written to {output}")
+
+
+@app.cli.command("rebuild-search")
+def rebuild_search():
+    """Rebuild the opportunity search index from the opportunity table"""
+    started = time.perf_counter()
+    db.session.execute(
+        text("INSERT INTO opportunity_fts (opportunity_fts) VALUES ('rebuild')")
+    )
+    db.session.execute(
+        text("INSERT INTO opportunity_fts (opportunity_fts) VALUES ('optimize')")
+    )
+    db.session.commit()
+    count = db.session.scalar(db.select(db.func.count()).select_from(Opportunity))
+    click.echo(f"indexed {count} opportunities in {time.perf_counter() - started:.1f}s")
+
+
+def sweep_blobs(dry_run=False):
+    """
+    Delete stored uploads no material refers to once the grace period is over.
+
+    Catches what delete_unreferenced_blobs had to leave: blobs released while
+    still recent, and uploads whose insert failed. Returns (key, bytes) for
+    each blob deleted, or that would be with dry_run.
+    """
+    cutoff = time.time() - app.config["BLOB_GC_GRACE_SECONDS"]
+    referenced = set(db.session.scalars(db.select(Material.file).distinct()))
+    swept = []
+    for key in storage.keys():
+        if key in referenced:
+            continue
+        try:
+            if storage.modified(key) > cutoff:
+                continue
+            size = os.path.getsize(storage.path(key))
+        except FileNotFoundError:
+            # removed by a commit in another process since keys() listed it
+            continue
+        if not dry_run:
+            remove_blob(key)
+        swept.append((key, size))
+    return swept
+
+
+@app.cli.command("gc-blobs")
+@click.option("--dry-run", is_flag=True, help="Only list what would be deleted.")
+def gc_blobs(dry_run):
+    """Delete stored uploads no material refers to, e.g. after failed inserts"""
+    swept = sweep_blobs(dry_run)
+    if dry_run:
+        for key, _ in swept:
+            click.echo(key)
+    verb = "would delete" if dry_run else "deleted"
+    freed = sum(size for _, size in swept)
+    click.echo(f"{verb} {len(swept)} unreferenced blob(s), {freed} bytes")
+
+
+@app.cli.command("run-worker")
+@click.option("--workers", default=2, show_default=True, help="Worker threads.")
+@click.option("--retry-failed", is_flag=True, help="Queue failed jobs again first.")
+def run_worker(workers, retry_failed):
+    """Process queued material jobs until interrupted"""
+    if retry_failed:
+        click.echo(f"retrying {jobs.retry_failed()} failed job(s)")
+    pool = WorkerPool(
+        jobs,
+        {"thumbnail": thumbnail_job, "text": text_job},
+        workers=workers,
+        logger=app.logger,
+    )
+    pool.start()
+    click.echo(f"processing jobs from {jobs.path} with {workers} worker(s)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pool.stop()
+
+
+REMINDER_FIELDS = {
+    "app_deadline": "Application deadline",
+    "personal_deadline": "Personal deadline",
+}
+
+
+def due_soon_query(field, today):
+    """Opportunities whose deadline falls within the largest reminder window"""
+    column = getattr(Opportunity, field)
+    return db.select(Opportunity.id, Opportunity.user_id, column).where(
+        column.between(
+            today, today + timedelta(days=max(app.config["REMINDER_WINDOWS"]))
+        ),
+        Opportunity.status.is_(None)
+        | Opportunity.status.not_in(app.config["REMINDER_SKIP_STATUSES"]),
+    )
+
+
+def queue_reminders(today=None):
+    """
+    Record a reminder for every deadline inside a reminder window.
+
+    Each deadline gets the nearest window it falls in; the unique constraint
+    turns a second run over the same day into a no-op.
+    """
+    today = today or date.today()
+    windows = sorted(app.config["REMINDER_WINDOWS"])
+    rows = []
+    for field in REMINDER_FIELDS:
+        # a range scan on the deadline index, not a walk over every user
+        for opp_id, user_id, deadline in db.session.execute(
+            due_soon_query(field, today)
+        ):
+            days = (deadline - today).days
+            window = next(window for window in windows if days <= window)
+            rows.append(
+                {
+                    "opp_id": opp_id,
+                    "user_id": user_id,
+                    "field": field,
+                    "deadline": deadline,
+                    "window_days": window,
+                    "created_at": datetime.now(),
+                }
+            )
+    if not rows:
+        return 0
+    # through the connection, the ORM result of a bulk insert has no rowcount
+    queued = (
+        db.session.connection()
+        .execute(sqlite_insert(Reminder).on_conflict_do_nothing(), rows)
+        .rowcount
+    )
+    db.session.commit()
+    return queued
+
+
+def deliver_reminders(sink, today=None):
+    """Send unsent reminders, marking each one sent as soon as it is delivered"""
+    today = today or date.today()
+    pending = db.session.execute(
+        db.select(Reminder, Opportunity.title, Opportunity.org_name, User.email)
+        .join(Opportunity, Reminder.opp_id == Opportunity.id)
+        .join(User, Reminder.user_id == User.id)
+        .where(Reminder.sent_at.is_(None))
+        .order_by(Reminder.id)
+    ).all()
+    open_tasks = {}
+    for opp_id, description in db.session.execute(
+        db.select(Task.opp_id, Task.description).where(
+            Task.opp_id.in_({row.Reminder.opp_id for row in pending}),
+            Task.status != "Done",
+        )
+    ):
+        open_tasks.setdefault(opp_id, []).append(description)
+    sent = 0
+    for reminder, title, org_name, email in pending:
+        days = (reminder.deadline - today).days
+        if days < 0:
+            # the deadline passed while the scheduler was down
+            reminder.sent_at = datetime.now()
+            db.session.commit()
+            continue
+        when = {0: "today", 1: "tomorrow"}.get(days, f"in {days} days")
+        label = REMINDER_FIELDS[reminder.field]
+        tasks = open_tasks.get(reminder.opp_id, [])
+        body = f"{label} for {title} ({org_name}) is {when}, {reminder.deadline}.\n"
+        if tasks:
+            body += "\nOpen tasks:\n" + "".join(f"- {task}\n" for task in tasks)
+        sink.send(
+            {
+                "id": reminder.id,
+                "email": email,
+                "subject": f"{label} {when}: {title}",
+                "body": body,
+            }
+        )
+        # committed per reminder, so a restart resends at most the one in flight
+        reminder.sent_at = datetime.now()
+        db.session.commit()
+        sent += 1
+    return sent
+
+
+@app.cli.command("run-scheduler")
+@click.option("--interval", type=int, help="Seconds between runs.")
+@click.option("--once", is_flag=True, help="Run one pass and exit.")
+def run_scheduler(interval, once):
+    """
+    Queue and send deadline reminders every REMINDER_INTERVAL seconds.
+
+    Also sweeps unreferenced uploads every BLOB_GC_INTERVAL seconds, the
+    same as 'flask gc-blobs', so the blobs of materials deleted soon after
+    upload don't stay on disk.
+    """
+    interval = interval or app.config["REMINDER_INTERVAL"]
+    sink = make_sink(app.config, app.instance_path)
+    next_sweep = time.monotonic()
+    while True:
+        queued = queue_reminders()
+        sent = deliver_reminders(sink)
+        line = f"{datetime.now():%Y-%m-%d %H:%M:%S} queued {queued}, sent {sent}"
+        if time.monotonic() >= next_sweep:
+            line += f", deleted {len(sweep_blobs())} unreferenced blob(s)"
+            next_sweep = time.monotonic() + app.config["BLOB_GC_INTERVAL"]
+        click.echo(line)
+        # the session must not hold a read transaction open while sleeping
+        db.session.remove()
+        if once:
+            break
+        time.sleep(interval)
+
+
+def stat_counts(user_id=None):
+    """The /stats counters computed from scratch with GROUP BY"""
+    queries = [
+        db.select(
+            Opportunity.user_id,
+            db.literal("status"),
+            db.func.coalesce(Opportunity.status, ""),
+            db.func.count(),
+        ).group_by(Opportunity.user_id, db.func.coalesce(Opportunity.status, "")),
+        db.select(
+            Opportunity.user_id,
+            db.literal("category"),
+            db.func.coalesce(Opportunity.category, ""),
+            db.func.count(),
+        ).group_by(Opportunity.user_id, db.func.coalesce(Opportunity.category, "")),
+        db.select(
+            Task.user_id, db.literal("tasks"), db.literal("total"), db.func.count()
+        ).group_by(Task.user_id),
+        db.select(
+            Task.user_id, db.literal("tasks"), db.literal("done"), db.func.count()
+        )
+        .where(Task.status == "Done")
+        .group_by(Task.user_id),
+        db.select(
+            Application_History.user_id,
+            db.literal("applied"),
+            db.func.substr(Application_History.application_date, 1, 7),
+            db.func.count(),
+        )
+        .where(Application_History.application_date.is_not(None))
+        .group_by(
+            Application_History.user_id,
+            db.func.substr(Application_History.application_date, 1, 7),
+        ),
+    ]
+    counts = {}
+    for query in queries:
+        if user_id is not None:
+            query = query.where(query.selected_columns[0] == user_id)
+        for row_user_id, kind, key, count in db.session.execute(query):
+            counts[(row_user_id, kind, key)] = count
+    return counts
+
+
+@app.cli.command("rebuild-stats")
+@click.option("--user-id", type=int, help="Only this user's counters.")
+def rebuild_stats(user_id):
+    """Recount the /stats summary from the tables and repair any drift"""
+    started = time.perf_counter()
+    counts = stat_counts(user_id)
+    current = db.select(UserStat.user_id, UserStat.kind, UserStat.key, UserStat.count)
+    stale = db.delete(UserStat)
+    if user_id is not None:
+        current = current.where(UserStat.user_id == user_id)
+        stale = stale.where(UserStat.user_id == user_id)
+    before = {
+        (row_user_id, kind, key): count
+        for row_user_id, kind, key, count in db.session.execute(current)
+        if count
+    }
+    drifted = {
+        key
+        for key in before.keys() | counts.keys()
+        if before.get(key) != counts.get(key)
+    }
+    db.session.execute(stale)
+    if counts:
+        db.session.execute(
+            db.insert(UserStat),
+            [
+                {"user_id": row_user_id, "kind": kind, "key": key, "count": count}
+                for (row_user_id, kind, key), count in counts.items()
+            ],
+        )
+    db.session.commit()
+    for row_user_id in {row_user_id for row_user_id, _, _ in drifted}:
+        cache.invalidate(row_user_id)
+    click.echo(
+        f"rebuilt {len(counts)} counters, {len(drifted)} had drifted, "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
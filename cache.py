@@ -0,0 +1,276 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class Cache:
+    """
+    Per-user read cache with LRU + TTL eviction.
+
+    Entries are grouped by user so every write can drop everything cached
+    for the user it touched. Each user has a generation number that
+    invalidate bumps and every key includes, so a value computed from data
+    read before a write is stored where no later read looks. Backends
+    implement _generation, _get, _set, invalidate and size; hit and miss
+    counters are kept per process. A backend error is logged and handled
+    as a miss rather than failing the request.
+    """
+
+    MISSING = object()
+    # backend failures that degrade to a miss instead of a 500
+    ERRORS = ()
+
+    def __init__(self, max_entries=10000, ttl=300, logger=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.logger = logger
+        self.hits = 0
+        self.misses = 0
+        self._counter_lock = threading.Lock()
+
+    def get_or_set(self, user_id, key, compute):
+        """Return the cached value for (user_id, key), computing it on a miss"""
+        try:
+            # read before compute: a write after this point bumps it
+            key = f"{self._generation(user_id)}:{key}"
+            value = self._get(user_id, key)
+        except self.ERRORS:
+            self._failed("read")
+            key = value = self.MISSING
+        if value is not self.MISSING:
+            with self._counter_lock:
+                self.hits += 1
+            return value
+        with self._counter_lock:
+            self.misses += 1
+        value = compute()
+        if key is not self.MISSING:
+            try:
+                self._set(user_id, key, value)
+            except self.ERRORS:
+                self._failed("write")
+        return value
+
+    def invalidate(self, user_id):
+        """Drop everything cached for a user"""
+        try:
+            self._invalidate(user_id)
+        except self.ERRORS:
+            self._failed("invalidate")
+
+    def _failed(self, action):
+        if self.logger:
+            self.logger.exception("cache %s failed", action)
+
+    def stats(self):
+        with self._counter_lock:
+            hits, misses = self.hits, self.misses
+        try:
+            entries = self.size()
+        except self.ERRORS:
+            self._failed("size")
+            entries = None
+        total = hits + misses
+        return {
+            "backend": type(self).__name__,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 3) if total else 0,
+            "entries": entries,
+        }
+
+
+class NullCache(Cache):
+    """Cache that never stores anything, for tests and debugging"""
+
+    def _generation(self, user_id):
+        return 0
+
+    def _get(self, user_id, key):
+        return self.MISSING
+
+    def _set(self, user_id, key, value):
+        pass
+
+    def _invalidate(self, user_id):
+        pass
+
+    def size(self):
+        return 0
+
+
+class MemoryCache(Cache):
+    """In-process backend: fastest, but each worker has its own copy"""
+
+    def __init__(self, max_entries=10000, ttl=300, logger=None):
+        super().__init__(max_entries, ttl, logger)
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def _generation(self, user_id):
+        with self._lock:
+            return self._generations.get(user_id, 0)
+
+    def _get(self, user_id, key):
+        with self._lock:
+            entry = self._entries.get((user_id, key))
+            if entry is None:
+                return self.MISSING
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._entries[(user_id, key)]
+                return self.MISSING
+            self._entries.move_to_end((user_id, key))
+            return value
+
+    def _set(self, user_id, key, value):
+        with self._lock:
+            self._entries[(user_id, key)] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end((user_id, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _invalidate(self, user_id):
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            for entry in [entry for entry in self._entries if entry[0] == user_id]:
+                del self._entries[entry]
+
+    def size(self):
+        return len(self._entries)
+
+
+class SQLiteCache(Cache):
+    """
+    File-backed backend shared by every worker on the host.
+
+    Values are pickled; a write in any worker invalidates the entries all
+    the others read. Hits don't write: their last-used times are collected
+    and saved in one statement once TOUCH_EVERY entries have been hit, and
+    always before an eviction.
+    """
+
+    ERRORS = (sqlite3.Error,)
+    # trimming to max_entries walks the index, so only do it every few writes
+    EVICT_EVERY = 64
+    TOUCH_EVERY = 64
+
+    def __init__(self, path, max_entries=10000, ttl=300, logger=None):
+        super().__init__(max_entries, ttl, logger)
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+        self._touched = {}
+        self._touch_lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "user_id INTEGER NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, "
+                "expires REAL NOT NULL, used REAL NOT NULL, "
+                "PRIMARY KEY (user_id, key))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_cache_used ON cache (used)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS generation ("
+                "user_id INTEGER PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _generation(self, user_id):
+        row = (
+            self._connect()
+            .execute("SELECT value FROM generation WHERE user_id = ?", (user_id,))
+            .fetchone()
+        )
+        return row[0] if row else 0
+
+    def _get(self, user_id, key):
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT value, expires FROM cache WHERE user_id = ? AND key = ?",
+            (user_id, key),
+        ).fetchone()
+        if row is None:
+            return self.MISSING
+        now = time.time()
+        if row[1] < now:
+            conn.execute(
+                "DELETE FROM cache WHERE user_id = ? AND key = ?", (user_id, key)
+            )
+            return self.MISSING
+        with self._touch_lock:
+            self._touched[(user_id, key)] = now
+            flush = len(self._touched) >= self.TOUCH_EVERY
+        if flush:
+            self._flush_touched(conn)
+        return pickle.loads(row[0])
+
+    def _flush_touched(self, conn):
+        with self._touch_lock:
+            touched, self._touched = self._touched, {}
+        conn.executemany(
+            "UPDATE cache SET used = ? WHERE user_id = ? AND key = ?",
+            [(used, user_id, key) for (user_id, key), used in touched.items()],
+        )
+
+    def _set(self, user_id, key, value):
+        conn = self._connect()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?)",
+            (user_id, key, pickle.dumps(value), now + self.ttl, now),
+        )
+        self._writes += 1
+        if self._writes % self.EVICT_EVERY == 0:
+            # evict the least recently used entries beyond the limit
+            self._flush_touched(conn)
+            conn.execute(
+                "DELETE FROM cache WHERE rowid IN (SELECT rowid FROM cache "
+                "ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def _invalidate(self, user_id):
+        conn = self._connect()
+        # bump first: a read that started earlier can only store its result
+        # under the old generation, which nothing looks up any more
+        conn.execute(
+            "INSERT INTO generation VALUES (?, 1) "
+            "ON CONFLICT (user_id) DO UPDATE SET value = value + 1",
+            (user_id,),
+        )
+        conn.execute("DELETE FROM cache WHERE user_id = ?", (user_id,))
+
+    def size(self):
+        return self._connect().execute("SELECT count(*) FROM cache").fetchone()[0]
+
+
+def make_cache(config, instance_path, logger=None):
+    """Build the backend named by CACHE_BACKEND: memory, sqlite or null"""
+    backend = config["CACHE_BACKEND"]
+    options = {
+        "max_entries": config["CACHE_MAX_ENTRIES"],
+        "ttl": config["CACHE_TTL"],
+        "logger": logger,
+    }
+    if backend == "memory":
+        return MemoryCache(**options)
+    if backend == "sqlite":
+        path = config["CACHE_PATH"] or os.path.join(instance_path, "cache.sqlite3")
+        return SQLiteCache(path, **options)
+    if backend == "null":
+        return NullCache(**options)
+    raise ValueError(f"unknown CACHE_BACKEND: {backend}")
@@ -1,5 +1,24 @@
-from flask import redirect, render_template, session
+import base64
+import csv
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import time
+import zlib
+from contextlib import contextmanager
+from flask import current_app, g, redirect, render_template, request, session
+from datetime import date, datetime, timedelta
 from functools import wraps
+from markupsafe import Markup, escape
+from sqlalchemy import and_, or_
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
 
 
 def login_required(f):
@@ -16,3 +35,441 @@ def login_required(f):
         return f(*args, **kwargs)
 
     return decorated_function
+
+
+DATE_FORMATS = ("%Y-%m-%d", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S", "%m/%d/%Y")
+
+
+def parse_date(value):
+    """
+    Parse a form or legacy string into a date.
+
+    Returns None for blank or unparseable values so the column stays NULL
+    instead of holding a string that can't be compared as a date.
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if value is None or isinstance(value, date):
+        return value
+    value = value.strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def encode_cursor(value, id):
+    """Pack a (sort value, id) position into an opaque URL-safe token"""
+    if isinstance(value, date):
+        value = value.isoformat()
+    raw = json.dumps([value, id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token, column=None):
+    """
+    Unpack a token made by encode_cursor.
+
+    The sort value is converted back to the column's Python type so it can
+    be bound against it. Returns None for a missing or tampered token.
+    """
+    if not token:
+        return None
+    try:
+        value, id = json.loads(
+            base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        )
+        if value is not None and column is not None:
+            if column.type.python_type is date:
+                value = date.fromisoformat(value)
+            elif column.type.python_type is datetime:
+                value = datetime.fromisoformat(value)
+        return value, int(id)
+    except (ValueError, TypeError, NotImplementedError):
+        return None
+
+
+def _beyond(sort_column, id_column, value, id, descending):
+    # rows strictly past (value, id) in the page order that share its NULL-ness;
+    # each branch leads with a bound on sort_column so an index ending in it
+    # can seek straight to the cursor instead of rescanning from the start
+    past_id = id_column < id if descending else id_column > id
+    if sort_column is None:
+        return past_id
+    if value is None:
+        return and_(sort_column.is_(None), past_id)
+    if descending:
+        return and_(sort_column <= value, or_(sort_column < value, past_id))
+    return and_(sort_column >= value, or_(sort_column > value, past_id))
+
+
+def _following(sort_column, position, descending):
+    # the rows after those _beyond covers: SQLite sorts NULL as the smallest
+    # value, so the undated rows follow a descending order and the dated ones
+    # follow the undated in an ascending order; None when nothing follows
+    if sort_column is None or position is None:
+        return None
+    if descending and position[0] is not None:
+        return sort_column.is_(None)
+    if not descending and position[0] is None:
+        return sort_column.isnot(None)
+    return None
+
+
+def keyset_query(
+    query, id_column, sort_column=None, descending=False, position=None, page_size=50
+):
+    """
+    The statement keyset_page runs first: rows past position in (sort_column,
+    id_column) order with the same NULL-ness, plus one to tell whether
+    another page follows.
+    """
+    if position is not None:
+        query = query.filter(
+            _beyond(sort_column, id_column, position[0], position[1], descending)
+        )
+    columns = [id_column] if sort_column is None else [sort_column, id_column]
+    query = query.order_by(*[c.desc() if descending else c.asc() for c in columns])
+    return query.limit(page_size + 1)
+
+
+def keyset_page(
+    query,
+    id_column,
+    sort_column=None,
+    descending=False,
+    after=None,
+    before=None,
+    page_size=50,
+):
+    """
+    Fetch one page of query ordered by (sort_column, id_column).
+
+    Pages are addressed by the cursor of the last row seen (after) or the
+    first row of the following page (before) instead of an OFFSET, so a page
+    costs the same however deep it is and rows inserted concurrently never
+    shift or repeat entries. Returns (items, next_cursor, prev_cursor).
+    """
+    position = decode_cursor(before or after, sort_column)
+    backwards = bool(before) and position is not None
+    order_desc = descending != backwards
+
+    def key(row):
+        return getattr(row, sort_column.key) if sort_column is not None else None
+
+    rows = keyset_query(
+        query, id_column, sort_column, order_desc, position, page_size
+    ).all()
+    following = _following(sort_column, position, order_desc)
+    if following is not None and len(rows) <= page_size:
+        # the page runs past the cursor's NULL-ness into the rest of the order
+        rows += keyset_query(
+            query.filter(following),
+            id_column,
+            sort_column,
+            order_desc,
+            page_size=page_size - len(rows),
+        ).all()
+    more = len(rows) > page_size
+    rows = rows[:page_size]
+    if backwards:
+        rows.reverse()
+
+    has_next = more if not backwards else True
+    has_prev = position is not None if not backwards else more
+    next_cursor = prev_cursor = None
+    if rows and has_next:
+        next_cursor = encode_cursor(key(rows[-1]), getattr(rows[-1], id_column.key))
+    if rows and has_prev:
+        prev_cursor = encode_cursor(key(rows[0]), getattr(rows[0], id_column.key))
+    return rows, next_cursor, prev_cursor
+
+
+@contextmanager
+def timed(name):
+    """
+    Time a block and report it as a Server-Timing metric on the response.
+
+    The after_request hook turns g.server_timing into the header, so the
+    cost of a write shows up in the browser's network panel.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - started) * 1000
+        g.setdefault("server_timing", []).append((name, elapsed))
+        current_app.logger.info("%s took %.1f ms", name, elapsed)
+
+
+def iter_records(stream, fmt):
+    """
+    Lazily yield dicts from a binary CSV or NDJSON stream.
+
+    Rows are decoded one line at a time so an upload of any size is never
+    held in memory. Blank NDJSON lines are skipped; a line that isn't a
+    JSON object is yielded as a ValueError for the caller to report.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    if fmt == "csv":
+        yield from csv.DictReader(text)
+    elif fmt == "ndjson":
+        for line in text:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield ValueError(f"invalid JSON: {e}")
+                continue
+            if not isinstance(record, dict):
+                yield ValueError("expected a JSON object")
+                continue
+            yield record
+    else:
+        raise ValueError(f"unsupported format: {fmt}")
+
+
+def record_format(filename, fmt=None):
+    """Pick csv or ndjson from an explicit format or the file extension"""
+    if fmt:
+        return fmt.lower()
+    extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    return {"csv": "csv", "ndjson": "ndjson", "jsonl": "ndjson"}.get(extension)
+
+
+class _Line:
+    # csv.writer target that hands each formatted row back instead of storing it
+    def write(self, value):
+        return value
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def csv_lines(header, rows):
+    """Yield a CSV header and then one encoded line per row"""
+    writer = csv.writer(_Line())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def ndjson_lines(header, rows, **extra):
+    """Yield one JSON object per row, keyed by header, plus any extra fields"""
+    for row in rows:
+        record = dict(extra, **dict(zip(header, row)))
+        yield json.dumps(record, default=_json_default) + "\n"
+
+
+def _ical_text(value):
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _ical_fold(line):
+    # RFC 5545 lines are at most 75 octets; continuations start with a space
+    data = line.encode()
+    parts = []
+    while len(data) > 75:
+        cut = 75 if not parts else 74
+        while cut and (data[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(data[:cut])
+        data = data[cut:]
+    parts.append(data)
+    return b"\r\n ".join(parts).decode()
+
+
+def ical_calendar(events):
+    """
+    Serialise all-day events to an iCalendar document.
+
+    Each event is a dict with uid, date, summary and stamp (a datetime).
+    """
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//Application Tracker//Deadlines//EN",
+        "CALSCALE:GREGORIAN",
+        "X-WR-CALNAME:Application deadlines",
+    ]
+    for event in events:
+        lines += [
+            "BEGIN:VEVENT",
+            "UID:" + event["uid"],
+            "DTSTAMP:" + event["stamp"].strftime("%Y%m%dT%H%M%SZ"),
+            "DTSTART;VALUE=DATE:" + event["date"].strftime("%Y%m%d"),
+            "DTEND;VALUE=DATE:"
+            + (event["date"] + timedelta(days=1)).strftime("%Y%m%d"),
+            "SUMMARY:" + _ical_text(event["summary"]),
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return "".join(_ical_fold(line) + "\r\n" for line in lines)
+
+
+_fingerprints = {}
+
+
+def file_fingerprint(path):
+    """
+    Short content hash of a file, recomputed only when its mtime or size changes.
+
+    Raises OSError if the file doesn't exist.
+    """
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _fingerprints.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b""):
+            sha256.update(chunk)
+    digest = sha256.hexdigest()[:12]
+    _fingerprints[path] = (key, digest)
+    return digest
+
+
+def precompress(path):
+    """
+    Write .gz (and .br when brotli is installed) siblings of a file.
+
+    Output is deterministic so rebuilding unchanged assets changes nothing.
+    Returns the paths written.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    written = []
+    with open(path + ".gz", "wb") as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    written.append(path + ".gz")
+    if brotli is not None:
+        with open(path + ".br", "wb") as f:
+            f.write(brotli.compress(data, quality=11))
+        written.append(path + ".br")
+    return written
+
+
+def _compressor(encoding):
+    # (compress(chunk, flush), finish()) for a streaming encoder
+    config = current_app.config
+    if encoding == "br":
+        encoder = brotli.Compressor(quality=config["COMPRESS_BR_LEVEL"])
+
+        def compress(chunk, flush=False):
+            return encoder.process(chunk) + (encoder.flush() if flush else b"")
+
+        return compress, encoder.finish
+
+    encoder = zlib.compressobj(config["COMPRESS_LEVEL"], zlib.DEFLATED, 31)
+
+    def compress(chunk, flush=False):
+        return encoder.compress(chunk) + (
+            encoder.flush(zlib.Z_SYNC_FLUSH) if flush else b""
+        )
+
+    return compress, encoder.flush
+
+
+def _compressed_stream(chunks, compress, finish, flush_size):
+    # the first chunk is flushed at once so the client gets its first byte
+    # immediately; after that, output is flushed every flush_size input bytes
+    pending, first = 0, True
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        if not chunk:
+            continue
+        pending += len(chunk)
+        flush = first or pending >= flush_size
+        if flush:
+            pending, first = 0, False
+        data = compress(chunk, flush)
+        if data:
+            yield data
+    yield finish()
+
+
+def compress_response(response):
+    """
+    Compress a dynamic response with brotli or gzip when the client accepts it.
+
+    Only COMPRESS_MIMETYPES are touched, so uploaded PDFs, images and files
+    that already carry a Content-Encoding pass through untouched, as do file
+    responses and bodies under COMPRESS_MIN_SIZE. Streamed responses are
+    compressed chunk by chunk.
+    """
+    config = current_app.config
+    if (
+        response.mimetype not in config["COMPRESS_MIMETYPES"]
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or "Content-Range" in response.headers
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    if response.status_code < 200 or response.status_code in (204, 304):
+        return response
+    if brotli is not None and request.accept_encodings["br"]:
+        encoding = "br"
+    elif request.accept_encodings["gzip"]:
+        encoding = "gzip"
+    else:
+        return response
+
+    if response.is_streamed:
+        # the encoder is built now, while the app context is still available
+        response.response = _compressed_stream(
+            response.response,
+            *_compressor(encoding),
+            config["COMPRESS_STREAM_FLUSH_SIZE"],
+        )
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < config["COMPRESS_MIN_SIZE"]:
+            return response
+        compress, finish = _compressor(encoding)
+        response.set_data(compress(data) + finish())
+    response.headers["Content-Encoding"] = encoding
+    # the compressed bytes differ from the original, so only a weak match holds
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+# highlight()/snippet() markers, control characters can't appear in user text
+HIGHLIGHT_START, HIGHLIGHT_END = "\x02", "\x03"
+
+
+def fts_query(text):
+    """
+    Turn free text into an FTS5 query that matches every word as a prefix.
+
+    Quoting each word keeps FTS5 operators and punctuation in user input from
+    being parsed as query syntax.
+    """
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text))
+
+
+def highlight_markup(text):
+    """HTML-escape FTS5 highlight output and turn its markers into <mark> tags"""
+    if text is None:
+        return None
+    return Markup(
+        str(escape(text))
+        .replace(HIGHLIGHT_START, "<mark>")
+        .replace(HIGHLIGHT_END, "</mark>")
+    )
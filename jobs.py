@@ -0,0 +1,163 @@
+import os
+import sqlite3
+import threading
+import time
+
+
+class JobQueue:
+    """
+    Persistent job queue in a SQLite file, shared by every process on the host.
+
+    A job is a (kind, key) pair and is unique, so enqueueing work that is
+    already queued, running or done is a no-op: results keyed by content
+    hash are computed once. Jobs left 'running' by a crashed worker are
+    queued again after `stale_after` seconds.
+    """
+
+    def __init__(self, path, stale_after=600):
+        self.path = path
+        self.stale_after = stale_after
+        self._local = threading.local()
+        self._wake = threading.Event()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS job ("
+                "id INTEGER PRIMARY KEY, kind TEXT NOT NULL, key TEXT NOT NULL, "
+                "status TEXT NOT NULL DEFAULT 'queued', error TEXT, "
+                "created REAL NOT NULL, started REAL, finished REAL, "
+                "UNIQUE (kind, key))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_job_status ON job (status, id)")
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def enqueue(self, kind, key):
+        self._connect().execute(
+            "INSERT OR IGNORE INTO job (kind, key, created) VALUES (?, ?, ?)",
+            (kind, key, time.time()),
+        )
+        self.wake()
+
+    def status(self, kind, key):
+        """(status, error) of a job, or None if it was never queued"""
+        conn = self._connect()
+        return conn.execute(
+            "SELECT status, error FROM job WHERE kind = ? AND key = ?", (kind, key)
+        ).fetchone()
+
+    def claim(self):
+        """Mark the oldest queued job running and return (id, kind, key)"""
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "UPDATE job SET status = 'queued' "
+                "WHERE status = 'running' AND started < ?",
+                (now - self.stale_after,),
+            )
+            job = conn.execute(
+                "UPDATE job SET status = 'running', started = ? WHERE id = "
+                "(SELECT id FROM job WHERE status = 'queued' ORDER BY id LIMIT 1) "
+                "RETURNING id, kind, key",
+                (now,),
+            ).fetchone()
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return job
+
+    def finish(self, job_id, error=None):
+        self._connect().execute(
+            "UPDATE job SET status = ?, error = ?, finished = ? WHERE id = ?",
+            ("failed" if error else "done", error, time.time(), job_id),
+        )
+
+    def retry_failed(self):
+        """Queue every failed job again, e.g. after installing a missing library"""
+        return (
+            self._connect()
+            .execute(
+                "UPDATE job SET status = 'queued', error = NULL WHERE status = 'failed'"
+            )
+            .rowcount
+        )
+
+    def forget(self, key):
+        """Drop every job for key, e.g. once its blob is deleted"""
+        self._connect().execute("DELETE FROM job WHERE key = ?", (key,))
+
+    def wake(self):
+        self._wake.set()
+
+    def wait(self, timeout):
+        """Block until a job is enqueued in this process or timeout passes"""
+        self._wake.wait(timeout)
+        self._wake.clear()
+
+
+class WorkerPool:
+    """
+    Threads that run queued jobs with the handler registered for their kind.
+
+    A handler takes the job key; an exception marks the job failed with its
+    message. Workers poll the queue every `poll` seconds, so jobs enqueued by
+    other processes are picked up too.
+    """
+
+    def __init__(self, queue, handlers, workers=2, poll=1.0, logger=None):
+        self.queue = queue
+        self.handlers = handlers
+        self.workers = workers
+        self.poll = poll
+        self.logger = logger
+        self._threads = []
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._threads:
+                return
+            for n in range(self.workers):
+                thread = threading.Thread(
+                    target=self.run, name=f"job-worker-{n}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self):
+        self._stopped.set()
+        self.queue.wake()
+        for thread in self._threads:
+            thread.join()
+
+    def run_once(self):
+        """Run one queued job, returning False if there was none"""
+        job = self.queue.claim()
+        if job is None:
+            return False
+        job_id, kind, key = job
+        try:
+            self.handlers[kind](key)
+        except Exception as e:
+            if self.logger:
+                self.logger.exception("job %s %s for %s failed", job_id, kind, key)
+            self.queue.finish(job_id, error=str(e) or type(e).__name__)
+        else:
+            self.queue.finish(job_id)
+        return True
+
+    def run(self):
+        while not self._stopped.is_set():
+            if not self.run_once():
+                self.queue.wait(self.poll)
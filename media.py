@@ -0,0 +1,86 @@
+import os
+import shutil
+import subprocess
+import tempfile
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional, without it there are no thumbnails
+    Image = None
+
+try:
+    import pypdf
+except ImportError:  # pypdf is optional, without it PDFs have no text
+    pypdf = None
+
+IMAGE_EXTENSIONS = {".jpg", ".png", ".gif"}
+
+
+class Unsupported(Exception):
+    """The file type can't be processed with the libraries installed here"""
+
+
+def _write_atomic(dest, write):
+    # results are read by other workers, never let them see a partial file
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(dest), prefix=".derived-")
+    os.close(fd)
+    try:
+        write(temp_path)
+        os.replace(temp_path, dest)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def make_thumbnail(source, dest, size):
+    """Write a PNG thumbnail of an image, or of a PDF's first page, to dest"""
+    if Image is None:
+        raise Unsupported("thumbnails need Pillow")
+    extension = os.path.splitext(source)[1].lower()
+    if extension == ".pdf":
+        if shutil.which("pdftoppm") is None:
+            raise Unsupported("PDF thumbnails need pdftoppm (poppler-utils)")
+        with tempfile.TemporaryDirectory() as directory:
+            prefix = os.path.join(directory, "page")
+            subprocess.run(
+                [
+                    "pdftoppm",
+                    "-png",
+                    "-singlefile",
+                    "-f",
+                    "1",
+                    "-scale-to",
+                    str(size),
+                    source,
+                    prefix,
+                ],
+                check=True,
+                capture_output=True,
+                timeout=60,
+            )
+            make_thumbnail(prefix + ".png", dest, size)
+        return
+    if extension not in IMAGE_EXTENSIONS:
+        raise Unsupported(f"no thumbnails for {extension} files")
+
+    def write(path):
+        with Image.open(source) as image:
+            image.thumbnail((size, size))
+            image.save(path, "PNG")
+
+    _write_atomic(dest, write)
+
+
+def extract_text(source, dest):
+    """Write the text of every page of a PDF to dest"""
+    if pypdf is None:
+        raise Unsupported("PDF text extraction needs pypdf")
+
+    def write(path):
+        reader = pypdf.PdfReader(source)
+        with open(path, "w", encoding="utf-8") as f:
+            for page in reader.pages:
+                f.write((page.extract_text() or "").strip() + "\n\n")
+
+    _write_atomic(dest, write)
@@ -0,0 +1,134 @@
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+STATEMENT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    """Cumulative Prometheus-style histogram for one label set"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def lines(self, name, labels):
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            yield f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}'
+        yield f'{name}_bucket{{{labels},le="+Inf"}} {self.count}'
+        yield f"{name}_sum{{{labels}}} {round(self.sum, 6)}"
+        yield f"{name}_count{{{labels}}} {self.count}"
+
+
+def _labels(**labels):
+    return ",".join(
+        '{}="{}"'.format(key, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for key, value in labels.items()
+    )
+
+
+class Metrics:
+    """
+    Per-endpoint request latency, SQL statement count and SQL time.
+
+    Counters live in this process only; with several workers each one
+    reports its own and the scraper sums them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = defaultdict(int)
+        self.latency = {}
+        self.statements = {}
+        self.sql_seconds = defaultdict(float)
+
+    def observe(self, endpoint, method, status, seconds, statements, sql_seconds):
+        with self._lock:
+            self.requests[(endpoint, method, status)] += 1
+            key = (endpoint, method)
+            if key not in self.latency:
+                self.latency[key] = Histogram(LATENCY_BUCKETS)
+                self.statements[key] = Histogram(STATEMENT_BUCKETS)
+            self.latency[key].observe(seconds)
+            self.statements[key].observe(statements)
+            self.sql_seconds[key] += sql_seconds
+
+    def render(self, extra=()):
+        """The collected metrics in Prometheus text exposition format"""
+        lines = [
+            "# HELP app_requests_total Requests handled, by endpoint and status.",
+            "# TYPE app_requests_total counter",
+        ]
+        with self._lock:
+            for (endpoint, method, status), count in sorted(self.requests.items()):
+                labels = _labels(endpoint=endpoint, method=method, status=status)
+                lines.append(f"app_requests_total{{{labels}}} {count}")
+            for name, kind, help, series in (
+                (
+                    "app_request_duration_seconds",
+                    "histogram",
+                    "Request latency.",
+                    self.latency,
+                ),
+                (
+                    "app_request_sql_statements",
+                    "histogram",
+                    "SQL statements issued per request.",
+                    self.statements,
+                ),
+            ):
+                lines += [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+                for (endpoint, method), histogram in sorted(series.items()):
+                    labels = _labels(endpoint=endpoint, method=method)
+                    lines.extend(histogram.lines(name, labels))
+            lines += [
+                "# HELP app_request_sql_seconds_total Time spent executing SQL.",
+                "# TYPE app_request_sql_seconds_total counter",
+            ]
+            for (endpoint, method), seconds in sorted(self.sql_seconds.items()):
+                labels = _labels(endpoint=endpoint, method=method)
+                lines.append(f"app_request_sql_seconds_total{{{labels}}} {seconds:.6f}")
+        for name, kind, help, value in extra:
+            lines += [
+                f"# HELP {name} {help}",
+                f"# TYPE {name} {kind}",
+                f"{name} {value}",
+            ]
+        return "\n".join(lines) + "\n"
+
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def latency_summary(latencies, elapsed):
+    """p50/p95/p99 and mean in milliseconds plus throughput for one benchmark run"""
+    ordered = sorted(latencies)
+    if not ordered:
+        return {
+            "requests": 0,
+            "p50_ms": None,
+            "p95_ms": None,
+            "p99_ms": None,
+            "mean_ms": None,
+            "requests_per_second": None,
+        }
+    return {
+        "requests": len(ordered),
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+        "requests_per_second": round(len(ordered) / elapsed, 1) if elapsed else None,
+    }
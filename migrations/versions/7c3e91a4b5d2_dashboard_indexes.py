@@ -0,0 +1,62 @@
+"""Dashboard indexes
+
+Revision ID: 7c3e91a4b5d2
+Revises: 2a9b0f3451d2
+Create Date: 2026-10-18 09:12:41.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c3e91a4b5d2'
+down_revision = '2a9b0f3451d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('opportunity', schema=None) as batch_op:
+        batch_op.create_index('ix_opportunity_user_status', ['user_id', 'status'], unique=False)
+        batch_op.create_index('ix_opportunity_user_category', ['user_id', 'category'], unique=False)
+        batch_op.create_index('ix_opportunity_user_app_deadline', ['user_id', 'app_deadline'], unique=False)
+        batch_op.create_index('ix_opportunity_user_personal_deadline', ['user_id', 'personal_deadline'], unique=False)
+
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.create_index('ix_task_user_status', ['user_id', 'status'], unique=False)
+        batch_op.create_index('ix_task_opp_user', ['opp_id', 'user_id'], unique=False)
+
+    with op.batch_alter_table('material', schema=None) as batch_op:
+        batch_op.create_index('ix_material_user_opp', ['user_id', 'opp_id'], unique=False)
+        batch_op.create_index('ix_material_opp_id', ['opp_id'], unique=False)
+
+    with op.batch_alter_table('link', schema=None) as batch_op:
+        batch_op.create_index('ix_link_user_id', ['user_id'], unique=False)
+
+    with op.batch_alter_table('application__history', schema=None) as batch_op:
+        batch_op.create_index('ix_application__history_user_opp', ['user_id', 'opp_id'], unique=False)
+        batch_op.create_index('ix_application__history_opp_id', ['opp_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('application__history', schema=None) as batch_op:
+        batch_op.drop_index('ix_application__history_opp_id')
+        batch_op.drop_index('ix_application__history_user_opp')
+
+    with op.batch_alter_table('link', schema=None) as batch_op:
+        batch_op.drop_index('ix_link_user_id')
+
+    with op.batch_alter_table('material', schema=None) as batch_op:
+        batch_op.drop_index('ix_material_opp_id')
+        batch_op.drop_index('ix_material_user_opp')
+
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_opp_user')
+        batch_op.drop_index('ix_task_user_status')
+
+    with op.batch_alter_table('opportunity', schema=None) as batch_op:
+        batch_op.drop_index('ix_opportunity_user_personal_deadline')
+        batch_op.drop_index('ix_opportunity_user_app_deadline')
+        batch_op.drop_index('ix_opportunity_user_category')
+        batch_op.drop_index('ix_opportunity_user_status')
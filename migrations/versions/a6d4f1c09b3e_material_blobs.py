@@ -0,0 +1,26 @@
+"""Material blobs
+
+Revision ID: a6d4f1c09b3e
+Revises: f3b9d2c8e6a1
+Create Date: 2026-10-18 15:20:11.604923
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6d4f1c09b3e'
+down_revision = 'f3b9d2c8e6a1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('material', schema=None) as batch_op:
+        batch_op.create_index('ix_material_file', ['file'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('material', schema=None) as batch_op:
+        batch_op.drop_index('ix_material_file')
@@ -0,0 +1,107 @@
+"""Typed deadlines
+
+Revision ID: b41d6e0f2a87
+Revises: 7c3e91a4b5d2
+Create Date: 2026-10-18 10:03:17.554391
+
+"""
+import logging
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+
+# revision identifiers, used by Alembic.
+revision = 'b41d6e0f2a87'
+down_revision = '7c3e91a4b5d2'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+DATE_FORMATS = ('%Y-%m-%d', '%Y-%m-%dT%H:%M', '%Y-%m-%d %H:%M:%S', '%m/%d/%Y')
+
+
+def to_iso_date(value):
+    # unparseable and blank strings become NULL rather than breaking Date reads;
+    # upgrade keeps the original text of the unparseable ones in notes
+    if not value:
+        return None
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value.strip(), fmt).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def upgrade():
+    # copy into new Date columns instead of altering in place: the batch
+    # table rebuild would CAST the strings to DATE, which SQLite treats as
+    # NUMERIC and truncates '2024-03-01' to 2024
+    with op.batch_alter_table('opportunity', schema=None) as batch_op:
+        batch_op.drop_index('ix_opportunity_user_personal_deadline')
+        batch_op.drop_index('ix_opportunity_user_app_deadline')
+        batch_op.add_column(sa.Column('app_deadline_date', sa.Date(), nullable=True))
+        batch_op.add_column(sa.Column('personal_deadline_date', sa.Date(), nullable=True))
+
+    conn = op.get_bind()
+    select = sa.text(
+        'SELECT id, app_deadline, personal_deadline, notes FROM opportunity '
+        'WHERE id > :last_id ORDER BY id LIMIT :limit'
+    )
+    update = sa.text(
+        'UPDATE opportunity SET app_deadline_date = :app_deadline, '
+        'personal_deadline_date = :personal_deadline, notes = :notes WHERE id = :id'
+    )
+    unparsed = []
+    last_id = 0
+    while True:
+        rows = conn.execute(select, {'last_id': last_id, 'limit': BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+        params = []
+        for row in rows:
+            values = {'id': row.id, 'notes': row.notes}
+            for name, label in (('app_deadline', 'Application deadline'),
+                                ('personal_deadline', 'Personal deadline')):
+                raw = getattr(row, name)
+                values[name] = to_iso_date(raw)
+                if values[name] is None and raw and raw.strip():
+                    # don't lose what the user typed: keep it where they'll see it
+                    kept = f'{label} (not a date): {raw.strip()}'
+                    values['notes'] = f"{values['notes']}\n{kept}" if values['notes'] else kept
+                    unparsed.append(row.id)
+            params.append(values)
+        conn.execute(update, params)
+        last_id = rows[-1].id
+    if unparsed:
+        ids = sorted(set(unparsed))
+        logger.warning(
+            '%d deadline(s) on %d opportunities were not dates; their text was '
+            'moved to notes: ids %s', len(unparsed), len(ids), ', '.join(map(str, ids))
+        )
+
+    with op.batch_alter_table('opportunity', schema=None) as batch_op:
+        batch_op.drop_column('app_deadline')
+        batch_op.drop_column('personal_deadline')
+        batch_op.alter_column('app_deadline_date', new_column_name='app_deadline')
+        batch_op.alter_column('personal_deadline_date', new_column_name='personal_deadline')
+
+    with op.batch_alter_table('opportunity', schema=None) as batch_op:
+        batch_op.create_index('ix_opportunity_user_app_deadline', ['user_id', 'app_deadline'], unique=False)
+        batch_op.create_index('ix_opportunity_user_personal_deadline', ['user_id', 'personal_deadline'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('opportunity', schema=None) as batch_op:
+        batch_op.alter_column('personal_deadline',
+               existing_type=sa.Date(),
+               type_=sa.String(length=255),
+               existing_nullable=True)
+        batch_op.alter_column('app_deadline',
+               existing_type=sa.Date(),
+               type_=sa.String(length=255),
+               existing_nullable=True)
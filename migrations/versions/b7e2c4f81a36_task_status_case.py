@@ -0,0 +1,25 @@
+"""Task status case
+
+Revision ID: b7e2c4f81a36
+Revises: d8f3b6a25c19
+Create Date: 2026-10-18 19:42:37.215804
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2c4f81a36'
+down_revision = 'd8f3b6a25c19'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # update_status used to write 'Not Done' while the column default is 'Not done'
+    op.execute("UPDATE task SET status = 'Not done' WHERE status = 'Not Done'")
+
+
+def downgrade():
+    pass
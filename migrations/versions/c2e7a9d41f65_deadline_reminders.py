@@ -0,0 +1,50 @@
+"""Deadline reminders
+
+Revision ID: c2e7a9d41f65
+Revises: a6d4f1c09b3e
+Create Date: 2026-10-18 16:41:52.237710
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2e7a9d41f65'
+down_revision = 'a6d4f1c09b3e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('reminder',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('opp_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('field', sa.String(length=32), nullable=False),
+    sa.Column('deadline', sa.Date(), nullable=False),
+    sa.Column('window_days', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['opp_id'], ['opportunity.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('opp_id', 'field', 'deadline', 'window_days', name='uq_reminder_window')
+    )
+    with op.batch_alter_table('reminder', schema=None) as batch_op:
+        batch_op.create_index('ix_reminder_sent_at', ['sent_at'], unique=False)
+
+    with op.batch_alter_table('opportunity', schema=None) as batch_op:
+        batch_op.create_index('ix_opportunity_app_deadline', ['app_deadline'], unique=False)
+        batch_op.create_index('ix_opportunity_personal_deadline', ['personal_deadline'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('opportunity', schema=None) as batch_op:
+        batch_op.drop_index('ix_opportunity_personal_deadline')
+        batch_op.drop_index('ix_opportunity_app_deadline')
+
+    with op.batch_alter_table('reminder', schema=None) as batch_op:
+        batch_op.drop_index('ix_reminder_sent_at')
+
+    op.drop_table('reminder')
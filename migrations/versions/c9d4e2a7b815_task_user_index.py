@@ -0,0 +1,32 @@
+"""Task user index
+
+Revision ID: c9d4e2a7b815
+Revises: e1c6a7d30b94
+Create Date: 2026-10-18 23:14:52.906137
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c9d4e2a7b815'
+down_revision = 'e1c6a7d30b94'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # the tasks page filters on status = 'Not done', so nothing may be left
+    # NULL or in another spelling
+    op.execute(
+        "UPDATE task SET status = 'Not done' "
+        "WHERE status IS NULL OR status NOT IN ('Done', 'Not done')"
+    )
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.create_index('ix_task_user_id', ['user_id', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_user_id')
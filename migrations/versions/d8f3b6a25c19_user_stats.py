@@ -0,0 +1,49 @@
+"""User stats
+
+Revision ID: d8f3b6a25c19
+Revises: c2e7a9d41f65
+Create Date: 2026-10-18 17:55:09.381426
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8f3b6a25c19'
+down_revision = 'c2e7a9d41f65'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('user_stat',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=32), nullable=False),
+    sa.Column('key', sa.String(length=255), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'kind', 'key')
+    )
+    # existing rows; 'flask rebuild-stats' does the same on demand
+    op.execute(
+        "INSERT INTO user_stat (user_id, kind, key, count) "
+        "SELECT user_id, 'status', coalesce(status, ''), count(*) "
+        "FROM opportunity GROUP BY user_id, coalesce(status, '') "
+        "UNION ALL "
+        "SELECT user_id, 'category', coalesce(category, ''), count(*) "
+        "FROM opportunity GROUP BY user_id, coalesce(category, '') "
+        "UNION ALL "
+        "SELECT user_id, 'tasks', 'total', count(*) FROM task GROUP BY user_id "
+        "UNION ALL "
+        "SELECT user_id, 'tasks', 'done', count(*) FROM task "
+        "WHERE status = 'Done' GROUP BY user_id "
+        "UNION ALL "
+        "SELECT user_id, 'applied', substr(application_date, 1, 7), count(*) "
+        "FROM application__history WHERE application_date IS NOT NULL "
+        "GROUP BY user_id, substr(application_date, 1, 7)"
+    )
+
+
+def downgrade():
+    op.drop_table('user_stat')
@@ -0,0 +1,26 @@
+"""Opportunity user index
+
+Revision ID: e1c6a7d30b94
+Revises: b7e2c4f81a36
+Create Date: 2026-10-18 21:05:12.441870
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e1c6a7d30b94'
+down_revision = 'b7e2c4f81a36'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('opportunity', schema=None) as batch_op:
+        batch_op.create_index('ix_opportunity_user_id', ['user_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('opportunity', schema=None) as batch_op:
+        batch_op.drop_index('ix_opportunity_user_id')
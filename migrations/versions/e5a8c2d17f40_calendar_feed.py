@@ -0,0 +1,38 @@
+"""Calendar feed
+
+Revision ID: e5a8c2d17f40
+Revises: b41d6e0f2a87
+Create Date: 2026-10-18 11:26:05.903112
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a8c2d17f40'
+down_revision = 'b41d6e0f2a87'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('feed_token', sa.String(length=64), nullable=True))
+        batch_op.create_index(batch_op.f('ix_user_feed_token'), ['feed_token'], unique=True)
+
+    with op.batch_alter_table('opportunity', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+        batch_op.create_index('ix_opportunity_user_updated_at', ['user_id', 'updated_at'], unique=False)
+
+    op.execute('UPDATE opportunity SET updated_at = created_at')
+
+
+def downgrade():
+    with op.batch_alter_table('opportunity', schema=None) as batch_op:
+        batch_op.drop_index('ix_opportunity_user_updated_at')
+        batch_op.drop_column('updated_at')
+
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_user_feed_token'))
+        batch_op.drop_column('feed_token')
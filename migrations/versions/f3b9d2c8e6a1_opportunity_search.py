@@ -0,0 +1,60 @@
+"""Opportunity search
+
+Revision ID: f3b9d2c8e6a1
+Revises: e5a8c2d17f40
+Create Date: 2026-10-18 14:02:37.418266
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b9d2c8e6a1'
+down_revision = 'e5a8c2d17f40'
+branch_labels = None
+depends_on = None
+
+COLUMNS = 'user_id, title, org_name, requirements, short_description, notes, other_info'
+NEW = ', '.join('new.' + column for column in COLUMNS.split(', '))
+OLD = ', '.join('old.' + column for column in COLUMNS.split(', '))
+
+
+def upgrade():
+    # external-content index: the text stays in opportunity, the triggers keep
+    # the index in step with every insert, edit and delete
+    op.execute(
+        'CREATE VIRTUAL TABLE opportunity_fts USING fts5('
+        'user_id UNINDEXED, title, org_name, requirements, short_description, '
+        "notes, other_info, content='opportunity', content_rowid='id', "
+        "tokenize='porter unicode61')"
+    )
+    op.execute(
+        'CREATE TRIGGER opportunity_fts_insert AFTER INSERT ON opportunity BEGIN '
+        f'INSERT INTO opportunity_fts (rowid, {COLUMNS}) VALUES (new.id, {NEW}); '
+        'END'
+    )
+    op.execute(
+        'CREATE TRIGGER opportunity_fts_delete AFTER DELETE ON opportunity BEGIN '
+        f'INSERT INTO opportunity_fts (opportunity_fts, rowid, {COLUMNS}) '
+        f"VALUES ('delete', old.id, {OLD}); "
+        'END'
+    )
+    # status and deadline edits don't touch the index
+    op.execute(
+        f'CREATE TRIGGER opportunity_fts_update AFTER UPDATE OF {COLUMNS} '
+        'ON opportunity BEGIN '
+        f'INSERT INTO opportunity_fts (opportunity_fts, rowid, {COLUMNS}) '
+        f"VALUES ('delete', old.id, {OLD}); "
+        f'INSERT INTO opportunity_fts (rowid, {COLUMNS}) VALUES (new.id, {NEW}); '
+        'END'
+    )
+    # existing rows; 'flask rebuild-search' does the same on demand
+    op.execute("INSERT INTO opportunity_fts (opportunity_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    op.execute('DROP TRIGGER opportunity_fts_update')
+    op.execute('DROP TRIGGER opportunity_fts_delete')
+    op.execute('DROP TRIGGER opportunity_fts_insert')
+    op.execute('DROP TABLE opportunity_fts')
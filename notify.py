@@ -0,0 +1,56 @@
+import json
+import os
+import smtplib
+from email.message import EmailMessage
+
+
+class FileSink:
+    """
+    Append reminders as JSON lines to a local file, a stand-in for email.
+
+    Each line carries the reminder's id, so a consumer can drop the rare
+    duplicate written just before a crash.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def send(self, reminder):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(reminder, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class SMTPSink:
+    """Send reminders as plain-text email through an SMTP relay"""
+
+    def __init__(self, host, port, sender, domain="app-tracker"):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.domain = domain
+
+    def send(self, reminder):
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = reminder["email"]
+        message["Subject"] = reminder["subject"]
+        # a stable Message-ID lets mail systems discard a resend
+        message["Message-ID"] = f"<reminder-{reminder['id']}@{self.domain}>"
+        message.set_content(reminder["body"])
+        with smtplib.SMTP(self.host, self.port, timeout=30) as smtp:
+            smtp.send_message(message)
+
+
+def make_sink(config, instance_path):
+    """Build the sink named by REMINDER_SINK: file or smtp"""
+    sink = config["REMINDER_SINK"]
+    if sink == "file":
+        return FileSink(
+            config["REMINDER_FILE"] or os.path.join(instance_path, "reminders.ndjson")
+        )
+    if sink == "smtp":
+        return SMTPSink(config["SMTP_HOST"], config["SMTP_PORT"], config["SMTP_SENDER"])
+    raise ValueError(f"unknown REMINDER_SINK: {sink}")
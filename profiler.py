@@ -0,0 +1,69 @@
+import cProfile
+import os
+import sys
+import threading
+from collections import Counter
+
+
+class RequestProfiler:
+    """
+    Profile one request on the current thread.
+
+    cProfile records exact call counts and times for the pstats file, while a
+    background thread samples the request thread's stack every `interval`
+    seconds to build a collapsed-stack file for flamegraph tools.
+    """
+
+    # only one cProfile can be active per process (Python 3.12+ refuses a
+    # second), so profiled requests take turns
+    _active = threading.Lock()
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.profile = cProfile.Profile()
+        self.samples = Counter()
+        self._thread_id = threading.get_ident()
+        self._stopped = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+
+    def start(self):
+        """Start profiling, or return False if another request is profiled"""
+        if not self._active.acquire(blocking=False):
+            return False
+        try:
+            self.profile.enable()
+        except BaseException:
+            self._active.release()
+            raise
+        self._sampler.start()
+        return True
+
+    def stop(self):
+        self.profile.disable()
+        self._stopped.set()
+        self._sampler.join()
+        self._active.release()
+
+    def _sample(self):
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                    f":{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def save(self, directory, name):
+        """Write <name>.pstats and <name>.collapsed to directory"""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, name)
+        self.profile.dump_stats(path + ".pstats")
+        with open(path + ".collapsed", "w") as collapsed:
+            for stack, count in self.samples.most_common():
+                collapsed.write(f"{stack} {count}\n")
+        return path
@@ -0,0 +1,29 @@
+// show a material's thumbnail and extracted text once its background jobs finish
+document.querySelectorAll("[data-material-status]").forEach(function (item) {
+  function poll(delay) {
+    fetch(item.dataset.materialStatus)
+      .then(function (response) {
+        return response.ok ? response.json() : {};
+      })
+      .then(function (jobs) {
+        var pending = false;
+        Object.keys(jobs).forEach(function (kind) {
+          var job = jobs[kind];
+          var target = item.querySelector('[data-job="' + kind + '"]');
+          if (job.status === "queued" || job.status === "running") {
+            pending = true;
+          } else if (job.status === "done" && target) {
+            target[target.tagName === "IMG" ? "src" : "href"] = job.url;
+            target.hidden = false;
+          }
+        });
+        // back off so a slow job doesn't mean a request every second
+        if (pending) {
+          setTimeout(function () {
+            poll(Math.min(delay * 2, 15000));
+          }, delay);
+        }
+      });
+  }
+  poll(1000);
+});
@@ -0,0 +1,76 @@
+// send forms marked with data-api to the JSON endpoints and update the page in
+// place; without JavaScript, or if the request fails, they post as before
+//
+//   data-api       endpoint, "{id}" is replaced by the form's id field
+//   data-method    PATCH or DELETE
+//   data-remove    selector of the ancestor to remove after a DELETE
+//   data-redirect  page to go to on success instead
+//
+// inputs with data-field are sent as that field, a checkbox sending data-on or
+// data-off; a form without any sends all its named inputs. After a PATCH,
+// elements inside [data-api-item="<endpoint>"] with data-field (text) or
+// data-field-href (link target) show the new values.
+document.querySelectorAll("form[data-api]").forEach(function (form) {
+  form.addEventListener("submit", function (event) {
+    // files still go through the multipart form
+    var file = form.querySelector('input[type="file"]');
+    if (file && file.files.length) {
+      return;
+    }
+    event.preventDefault();
+    var id = form.elements.id ? form.elements.id.value : "";
+    var url = form.dataset.api.replace("{id}", id);
+    var method = form.dataset.method;
+    var fields = form.querySelectorAll("[data-field]");
+    var body = fields.length ? {} : Object.fromEntries(new FormData(form));
+    fields.forEach(function (input) {
+      if (input.type === "checkbox") {
+        body[input.dataset.field] = input.checked
+          ? input.dataset.on
+          : input.dataset.off;
+      } else {
+        body[input.dataset.field] = input.value;
+      }
+    });
+    fetch(url, {
+      method: method,
+      headers: { "Content-Type": "application/json" },
+      body: method === "DELETE" ? undefined : JSON.stringify(body),
+    })
+      .then(function (response) {
+        if (!response.ok) {
+          throw new Error(response.status);
+        }
+        return response.status === 204 ? null : response.json();
+      })
+      .then(function (row) {
+        if (form.dataset.redirect) {
+          window.location.href = form.dataset.redirect;
+          return;
+        }
+        if (form.dataset.remove) {
+          form.closest(form.dataset.remove).remove();
+        }
+        if (row) {
+          document
+            .querySelectorAll('[data-api-item="' + url + '"]')
+            .forEach(function (item) {
+              item.querySelectorAll("[data-field]").forEach(function (el) {
+                el.textContent = row[el.dataset.field];
+              });
+              item.querySelectorAll("[data-field-href]").forEach(function (el) {
+                el.href = row[el.dataset.fieldHref];
+              });
+            });
+        }
+        var modal = form.closest(".modal");
+        if (modal) {
+          bootstrap.Modal.getOrCreateInstance(modal).hide();
+        }
+      })
+      .catch(function () {
+        // let the server render the outcome, e.g. its error message
+        form.submit();
+      });
+  });
+});
@@ -0,0 +1,98 @@
+import hashlib
+import os
+import re
+import tempfile
+
+
+class InvalidUpload(ValueError):
+    """An upload was rejected before anything was stored"""
+
+
+class BlobStore:
+    """
+    Content-addressed file storage for uploaded materials.
+
+    Uploads are streamed to a temporary file in chunks while being hashed,
+    then moved to <root>/<first two hex digits>/<sha256><ext>. Identical
+    uploads share one blob; the database is the reference count, so callers
+    delete a blob once no row points at its key. Saving refreshes a blob's
+    mtime, which callers compare against a grace period so a blob isn't
+    deleted while a new row for it is still uncommitted.
+    """
+
+    KEY = re.compile(r"^[0-9a-f]{64}(\.[a-z0-9]+)?$")
+
+    def __init__(self, root, extensions, chunk_size=64 * 1024):
+        self.root = root
+        self.extensions = {extension.lower() for extension in extensions}
+        self.chunk_size = chunk_size
+
+    def extension(self, filename):
+        """Lower-cased extension of filename, if it is an allowed upload type"""
+        extension = os.path.splitext(filename or "")[1].lower()
+        if extension not in self.extensions:
+            raise InvalidUpload(
+                "Invalid file extension, allowed: " + ", ".join(sorted(self.extensions))
+            )
+        return extension
+
+    def relpath(self, key):
+        """Blob location relative to root, as a URL path"""
+        if not self.KEY.match(key or ""):
+            raise KeyError(key)
+        return f"{key[:2]}/{key}"
+
+    def path(self, key):
+        return os.path.join(self.root, *self.relpath(key).split("/"))
+
+    def exists(self, key):
+        try:
+            return os.path.isfile(self.path(key))
+        except KeyError:
+            return False
+
+    def save(self, stream, filename):
+        """Store a file-like object and return its key"""
+        extension = self.extension(filename)
+        os.makedirs(self.root, exist_ok=True)
+        digest = hashlib.sha256()
+        # same filesystem as the blobs, so the final move is an atomic rename
+        fd, temp_path = tempfile.mkstemp(dir=self.root, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as temp:
+                for chunk in iter(lambda: stream.read(self.chunk_size), b""):
+                    digest.update(chunk)
+                    temp.write(chunk)
+            key = digest.hexdigest() + extension
+            path = self.path(key)
+            try:
+                # an identical blob exists: mark it as just uploaded again
+                os.utime(path)
+                os.remove(temp_path)
+            except FileNotFoundError:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return key
+
+    def modified(self, key):
+        """When the blob was last saved, as a timestamp"""
+        return os.path.getmtime(self.path(key))
+
+    def delete(self, key):
+        try:
+            os.remove(self.path(key))
+        except (KeyError, FileNotFoundError):
+            pass
+
+    def keys(self):
+        """Every stored key, for sweeping blobs no row refers to"""
+        for prefix in os.listdir(self.root) if os.path.isdir(self.root) else ():
+            directory = os.path.join(self.root, prefix)
+            if os.path.isdir(directory):
+                for name in os.listdir(directory):
+                    if self.KEY.match(name):
+                        yield name
@@ -0,0 +1,43 @@
+import os
+import tempfile
+from datetime import datetime
+
+import pytest
+
+# configure before app.py builds its engine, cache and queue
+scratch = tempfile.mkdtemp(prefix="app-tracker-test-")
+os.environ.update(
+    {
+        "DATABASE_URL": "sqlite:///" + os.path.join(scratch, "test.db"),
+        "CACHE_BACKEND": "null",
+        "UPLOAD_FOLDER": os.path.join(scratch, "uploads"),
+        "JOB_QUEUE_PATH": os.path.join(scratch, "jobs.sqlite3"),
+    }
+)
+
+from werkzeug.security import generate_password_hash  # noqa: E402
+
+from app import User, app, db  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    """A test client logged in as a new user, on an empty database"""
+    app.config.update(TESTING=True, JOB_WORKERS=0)
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        user = User(
+            name="test",
+            email="test@example.com",
+            username="test",
+            password=generate_password_hash("password"),
+            created_at=datetime.now(),
+        )
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+    client = app.test_client()
+    client.post("/login", data={"username": "test", "password": "password"})
+    client.user_id = user_id
+    yield client
@@ -0,0 +1,51 @@
+import io
+import json
+
+import pytest
+
+from app import Opportunity, app, db
+
+
+def post_ndjson(client, *records):
+    body = "\n".join(json.dumps(record) for record in records).encode()
+    return client.post(
+        "/import",
+        data={"file": (io.BytesIO(body), "opps.ndjson")},
+        content_type="multipart/form-data",
+    )
+
+
+def priorities(client):
+    with app.app_context():
+        return (
+            db.session.execute(
+                db.select(Opportunity.priority).where(
+                    Opportunity.user_id == client.user_id
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+
+@pytest.mark.parametrize("priority", [True, 2.7])
+def test_import_rejects_non_integer_priority(client, priority):
+    response = post_ndjson(
+        client, {"org_name": "Org", "title": "Role", "priority": priority}
+    )
+    assert response.status_code == 400
+    summary = response.get_json()
+    assert summary["failed"] == 1
+    assert "priority is not a whole number" in summary["errors"][0]["error"]
+    assert priorities(client) == []
+
+
+def test_import_accepts_whole_numbers(client):
+    response = post_ndjson(
+        client,
+        {"org_name": "Org", "title": "A", "priority": 3},
+        {"org_name": "Org", "title": "B", "priority": 2.0},
+        {"org_name": "Org", "title": "C", "priority": "1"},
+    )
+    assert response.status_code == 200
+    assert sorted(priorities(client)) == [1, 2, 3]
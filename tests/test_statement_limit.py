@@ -0,0 +1,53 @@
+from datetime import datetime
+
+import pytest
+
+from app import Material, Opportunity, Task, TooManyStatements, app, db
+
+
+@pytest.fixture
+def opp_id(client):
+    with app.app_context():
+        opp = Opportunity(
+            user_id=client.user_id, org_name="Org", title="Role", other_info="Pay: high"
+        )
+        db.session.add(opp)
+        db.session.flush()
+        # enough of both collections that a join across them would multiply
+        db.session.add_all(
+            Task(
+                user_id=client.user_id,
+                opp_id=opp.id,
+                description=f"task {n:02}",
+                created_at=datetime.now(),
+            )
+            for n in range(20)
+        )
+        db.session.add_all(
+            Material(
+                user_id=client.user_id,
+                opp_id=opp.id,
+                title=f"material {n:02}",
+                file=f"f{n}.pdf",
+            )
+            for n in range(20)
+        )
+        db.session.commit()
+        opp_id = opp.id
+    yield opp_id
+    app.config["SQL_STATEMENT_LIMIT"] = None
+
+
+def test_view_runs_a_fixed_number_of_statements(client, opp_id):
+    app.config["SQL_STATEMENT_LIMIT"] = 3
+    response = client.get(f"/view/{opp_id}")
+    assert response.status_code == 200
+    page = response.get_data(as_text=True)
+    assert all(f"task {n:02}" in page for n in range(20))
+    assert all(f"material {n:02}" in page for n in range(20))
+
+
+def test_statement_limit_fails_chatty_requests(client, opp_id):
+    app.config["SQL_STATEMENT_LIMIT"] = 0
+    with pytest.raises(TooManyStatements):
+        client.get(f"/view/{opp_id}")